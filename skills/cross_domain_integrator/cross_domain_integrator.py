@@ -29,8 +29,19 @@ class CrossDomainIntegrator:
         self.log_folder = Path(self.config['output']['log_folder'])
         self.log_prefix = self.config['output']['log_prefix']
 
-        # Ensure log folder exists
+        # Ensure log folder and routing destinations exist (once, not per item)
         self.log_folder.mkdir(exist_ok=True)
+        self.personal_dir = Path(self.personal_route)
+        self.business_dir = Path(self.business_route)
+        self.personal_dir.mkdir(exist_ok=True)
+        self.business_dir.mkdir(exist_ok=True)
+
+        # classification -> (destination dir, filename prefix)
+        # personal: Pending_Approval for HITL; business: Plans for Auto LinkedIn Poster
+        self._routes = {
+            'personal': (self.personal_dir, ''),
+            'business': (self.business_dir, 'business_')
+        }
 
     def classify_item(self, content, filename):
         """
@@ -100,25 +111,13 @@ class CrossDomainIntegrator:
             dict: Routing result with destination and status
         """
         filename = Path(file_path).name
-        source_dir = Path(file_path).parent
 
-        if classification == 'personal':
-            # Route to Pending_Approval for HITL
-            dest_dir = Path(self.personal_route)
-            dest_dir.mkdir(exist_ok=True)
-            dest_path = dest_dir / filename
+        # Anything not classified as personal is routed as business
+        dest_dir, prefix = self._routes.get(classification, self._routes['business'])
+        dest_path = dest_dir / f"{prefix}{filename}"
 
-            # Add routing metadata
-            self._add_routing_metadata(file_path, classification, confidence, matched_keywords)
-
-        else:  # business
-            # Route to Plans for Auto LinkedIn Poster
-            dest_dir = Path(self.business_route)
-            dest_dir.mkdir(exist_ok=True)
-            dest_path = dest_dir / f"business_{filename}"
-
-            # Add routing metadata
-            self._add_routing_metadata(file_path, classification, confidence, matched_keywords)
+        # Add routing metadata
+        self._add_routing_metadata(file_path, classification, confidence, matched_keywords)
 
         # Move the file
         try:
@@ -526,7 +526,7 @@ generated_by: Social Summary Generator
         print("SOCIAL SUMMARY GENERATOR")
         print("="*60)
         print(f"Error recovery: Enabled (logs to /Errors/, manual actions to /Plans/)")
-        print(f"Audit logging: Enabled (logs to /Logs/audit_*.json)")
+        print(f"Audit logging: Enabled (logs to /Logs/audit_*.jsonl)")
 
         # Find social files
         social_files = self.find_social_files()
@@ -631,7 +631,8 @@ generated_by: Social Summary Generator
                     self.skill_name,
                     e,
                     input_data={'file': str(file_path), 'content_preview': content[:200] if content else 'N/A'},
-                    recovery_action="Review file format and retry processing manually."
+                    recovery_action="Review file format and retry processing manually.",
+                    wait=True
                 )
                 
                 # Create manual action draft
@@ -639,7 +640,8 @@ generated_by: Social Summary Generator
                     self.skill_name,
                     'summary_generation',
                     f"Generate summary and draft response for: {file_path.name}\n\nOriginal file: {file_path}",
-                    original_data={'file': str(file_path)}
+                    original_data={'file': str(file_path)},
+                    wait=True
                 )
                 
                 if error_file:
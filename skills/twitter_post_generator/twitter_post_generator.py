@@ -506,7 +506,7 @@ generated_by: Twitter Post Generator
         print("TWITTER POST GENERATOR")
         print("="*60)
         print(f"Error recovery: Enabled")
-        print(f"Audit logging: Enabled (logs to /Logs/audit_*.json)")
+        print(f"Audit logging: Enabled (logs to /Logs/audit_*.jsonl)")
 
         # Find Twitter files
         twitter_files = self.find_twitter_files()
@@ -8,14 +8,19 @@ Integrates with: Cross Domain Integrator, Audit Logger, Skills
 """
 
 import os
+import re
 import sys
-import shutil
-import glob
+import mmap
+import functools
+import contextlib
 import time
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Generator
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -29,6 +34,213 @@ except ImportError:
     AUDIT_LOGGER_AVAILABLE = False
     print("Warning: AuditLogger not available, running without audit logging")
 
+# Optional inotify support (Linux) for event-driven waits between iterations
+try:
+    from inotify_simple import INotify, flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+# Optional orjson for the fast audit path (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional liburing bindings (Linux) for batching renames into one io_uring submit
+try:
+    import liburing
+    LIBURING_AVAILABLE = sys.platform.startswith('linux')
+except ImportError:
+    LIBURING_AVAILABLE = False
+
+# Content keyword -> task class rank (lower rank wins, as in _determine_task_type)
+_LEAD, _FINANCIAL, _SCHEDULE = 0, 1, 2
+_TASK_KEYWORDS = {
+    'sales': _LEAD, 'client': _LEAD, 'project': _LEAD,
+    'urgent': _FINANCIAL, 'invoice': _FINANCIAL, 'payment': _FINANCIAL,
+    'meeting': _SCHEDULE, 'schedule': _SCHEDULE, 'calendar': _SCHEDULE
+}
+
+# Files below this size are read directly; larger ones are scanned through mmap
+_MMAP_MIN_SIZE = 4096
+
+# Bytes decoded from the start of a file for frontmatter and preview
+_HEAD_BYTES = 64 * 1024
+
+
+def _build_trie(words) -> Dict[str, Any]:
+    """Build a nested-dict trie; '' marks the end of a word"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+    return trie
+
+
+def _trie_to_regex(node: Dict[str, Any]) -> str:
+    """Render a trie as a prefix-factored regex so re matches it in a single pass"""
+    alternatives = [re.escape(ch) + _trie_to_regex(child)
+                    for ch, child in sorted(node.items()) if ch]
+    if not alternatives:
+        return ''
+    if len(alternatives) == 1 and '' not in node:
+        return alternatives[0]
+    group = '(?:' + '|'.join(alternatives) + ')'
+    return group + '?' if '' in node else group
+
+
+# Keyword matcher generated from the keyword trie (e.g. "c(?:alendar|lient)|...").
+# Bytes pattern so it runs directly over raw file data or an mmap, and
+# case-insensitive so content never needs a lowercase copy.
+_KEYWORD_TRIE_RE = re.compile(_trie_to_regex(_build_trie(_TASK_KEYWORDS)).encode('ascii'),
+                              re.IGNORECASE)
+
+# Platform checks for lead classification
+_FACEBOOK_INSTAGRAM_RE = re.compile(rb'facebook|instagram', re.IGNORECASE)
+_TWITTER_RE = re.compile(rb'twitter', re.IGNORECASE)
+_LINKEDIN_RE = re.compile(rb'linkedin', re.IGNORECASE)
+
+
+def _best_rank(ranks) -> Optional[int]:
+    """Lowest class rank in an iterable of ranks, stopping early on a lead keyword"""
+    best = None
+    for rank in ranks:
+        if rank == _LEAD:
+            return _LEAD  # Highest priority class, no need to scan further
+        if best is None or rank < best:
+            best = rank
+    return best
+
+
+def _keyword_class(data) -> Optional[int]:
+    """Best (lowest) keyword class rank found in raw bytes / mmap data, or None"""
+    return _best_rank(_TASK_KEYWORDS[m.group().lower().decode('ascii')]
+                      for m in _KEYWORD_TRIE_RE.finditer(data))
+
+
+@contextlib.contextmanager
+def _map_file(file_path: str):
+    """Yield file contents as bytes (small files) or a read-only mmap (large files)"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+
+# Max SQEs per io_uring batch
+_URING_BATCH = 256
+
+# Max iovec entries per writev() call (POSIX IOV_MAX is at least 1024 on Linux)
+_IOV_MAX = 1024
+
+# Worker threads for per-file processing within an iteration
+_MAX_WORKERS = 8
+
+
+def _encode_audit_record(record: Dict[str, Any]) -> bytes:
+    """Encode an audit record as one newline-terminated JSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record) + b'\n'
+    return (json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n').encode('utf-8')
+
+# Draft written to /Pending_Approval by skill execution (rendered with format_map)
+_DRAFT_TEMPLATE = (
+    "---\n"
+    "type: skill_draft\n"
+    "source_file: {source}\n"
+    "skill: {skill}\n"
+    "status: pending_approval\n"
+    "created: {iso}\n"
+    "requires_hitl: true\n"
+    "---\n"
+    "\n"
+    "# Draft Generated by {skill}\n"
+    "\n"
+    "**Generated:** {human}\n"
+    "**Source:** {name}\n"
+    "\n"
+    "---\n"
+    "\n"
+    "## Draft Content\n"
+    "\n"
+    "[Skill would generate content here]\n"
+    "\n"
+    "---\n"
+    "\n"
+    "## Action Required\n"
+    "\n"
+    "- [ ] Review and edit if needed\n"
+    "- [ ] Move to /Approved to execute\n"
+    "- [ ] Or move to /Rejected if not appropriate\n"
+    "\n"
+    "---\n"
+    "*Generated by Ralph Wiggum Loop (Gold Tier)*\n"
+    "*Requires HITL approval*\n"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_multi_step_type(task_type: str) -> bool:
+    """Whether a task type needs the multi-step (HITL/MCP) workflow"""
+    multi_step_types = (
+        'facebook_instagram_lead', 'twitter_lead', 'linkedin_lead',
+        'social_media_lead', 'email_response_required'
+    )
+    return task_type in multi_step_types
+
+
+@functools.lru_cache(maxsize=256)
+def _workflow_for_type(task_type: str) -> tuple:
+    """Workflow stages for a task type (cached; callers copy before mutating)"""
+    # Default workflow for social media leads
+    if any(lead in task_type for lead in ['lead', 'social']):
+        return (
+            'analysis',
+            'skill_execution',  # Generate draft
+            'hitl_approval',    # Wait for approval
+            'mcp_execution',    # Execute via MCP
+            'audit_logging',
+            'completion'
+        )
+    
+    # Financial tasks
+    if 'financial' in task_type:
+        return ('analysis', 'skill_execution', 'completion')
+    
+    # Schedule tasks
+    if 'schedule' in task_type:
+        return ('analysis', 'mcp_execution', 'completion')
+    
+    # Default
+    return ('analysis', 'completion')
+
+
+@dataclass(slots=True)
+class StageEvent:
+    """A single workflow stage transition recorded in the task history"""
+    file: str
+    stage: str
+    ts_ns: int
+    result: str
+
+
+@dataclass(slots=True)
+class TaskOutcome:
+    """What one file's workflow step produced, applied by the main thread"""
+    task: Dict[str, Any]
+    started: bool
+    complete: bool
+    output: List[str]
+    audit: List[Dict[str, Any]]
+    moves: List[tuple]
+    history: List[StageEvent]
+
 
 class RalphWiggumLoop:
     """
@@ -36,9 +248,19 @@ class RalphWiggumLoop:
     Handles multi-step autonomous tasks with full workflow integration
     """
     
+    __slots__ = (
+        'max_iterations', 'iteration_count', 'processed_files', 'task_history',
+        'fast_audit', 'audit_enabled', 'audit_logger', '_audit_batch', '_audit_fd', '_audit_fd_day',
+        'needs_action_dir', 'pending_approval_dir', 'approved_dir', 'done_dir',
+        'plans_dir', 'logs_dir', '_tasks', '_remaining', '_pending_moves', '_uring_ok', '_worker', '_idle_iteration', '_inotify', '_watches'
+    )
+    
     # Maximum iterations for Gold Tier
     DEFAULT_MAX_ITERATIONS = 20
     
+    # Max time to block waiting for a filesystem event when idle (ms)
+    IDLE_WAIT_TIMEOUT_MS = 30_000
+    
     # Task workflow stages
     STAGES = {
         'analysis': 1,
@@ -49,22 +271,36 @@ class RalphWiggumLoop:
         'completion': 6
     }
     
-    def __init__(self, max_iterations: int = None, audit_enabled: bool = True):
+    def __init__(self, max_iterations: int = None, audit_enabled: bool = True,
+                 fast_audit: bool = False):
         """
         Initialize the Ralph Wiggum Loop.
         
         Args:
             max_iterations: Maximum loop iterations (default: 20 for Gold Tier)
             audit_enabled: Enable audit logging (default: True)
+            fast_audit: Batch audit records straight into AuditLogger's
+                        Logs/audit_YYYYMMDD.jsonl files (default: False)
         """
         self.max_iterations = max_iterations or self.DEFAULT_MAX_ITERATIONS
         self.iteration_count = 0
         self.processed_files = []
         self.task_history = []
-        self.audit_enabled = audit_enabled and AUDIT_LOGGER_AVAILABLE
+        self._tasks = {}  # file path -> in-flight task (with its workflow generator)
+        self._remaining = 0  # files from the last iteration not yet moved out
+        self._pending_moves = []  # (src, dest) renames flushed at the end of an iteration
+        self._uring_ok = LIBURING_AVAILABLE  # cleared after the first io_uring failure
+        # Per-thread buffers set while _process_one runs a file's workflow; the
+        # output, audit records, moves and history land there, not in shared state
+        self._worker = threading.local()
+        self.fast_audit = audit_enabled and fast_audit
+        self.audit_enabled = audit_enabled and (self.fast_audit or AUDIT_LOGGER_AVAILABLE)
+        self._audit_batch = []
+        self._audit_fd = None
+        self._audit_fd_day = None  # YYYYMMDD of the file _audit_fd appends to
         
         # Initialize audit logger
-        if self.audit_enabled:
+        if self.audit_enabled and not self.fast_audit:
             try:
                 self.audit_logger = AuditLogger(project_root)
             except Exception as e:
@@ -83,21 +319,102 @@ class RalphWiggumLoop:
         for dir_path in [self.pending_approval_dir, self.approved_dir, 
                          self.done_dir, self.plans_dir, self.logs_dir]:
             dir_path.mkdir(exist_ok=True)
+        
+        # Watch workflow directories so idle iterations can sleep until a change
+        self._idle_iteration = False
+        self._inotify = None
+        if INOTIFY_AVAILABLE:
+            try:
+                self._inotify = INotify()
+                watch_flags = flags.MOVED_TO | flags.CREATE | flags.CLOSE_WRITE
+                self._watches = [
+                    self._inotify.add_watch(str(d), watch_flags)
+                    for d in (self.needs_action_dir, self.pending_approval_dir, self.approved_dir)
+                    if d.exists()
+                ]
+            except OSError as e:
+                print(f"Warning: inotify unavailable, falling back to polling: {e}")
+                self._inotify = None
+    
+    def _say(self, message: str):
+        """Print progress, or buffer it while _process_one runs a workflow step"""
+        output = getattr(self._worker, 'output', None)
+        if output is None:
+            print(message)
+        else:
+            output.append(message)
     
     def log_audit(self, action_type: str, target: str, result: str = "success",
                   parameters: Dict = None, message: str = None):
-        """Log action to audit logger if enabled"""
-        if self.audit_enabled:
+        """Queue an audit record; records are written in one batch by flush_audit()"""
+        batch = getattr(self._worker, 'audit', self._audit_batch)
+        if self.fast_audit:
+            now = datetime.now()
+            batch.append({
+                "timestamp": now.isoformat(),
+                "date": now.strftime("%Y-%m-%d"),
+                "action_type": action_type,
+                "actor": "AI_Employee_System",
+                "target": target,
+                "parameters": parameters or {},
+                "approval_status": "not_required",
+                "result": result,
+                "message": message or f"Ralph Loop: {action_type}"
+            })
+        elif self.audit_enabled:
+            batch.append({
+                "action_type": action_type,
+                "target": target,
+                "result": result,
+                "parameters": parameters or {},
+                "message": message or f"Ralph Loop: {action_type}"
+            })
+    
+    def flush_audit(self):
+        """Write buffered audit records (one AuditLogger.log_many or one writev)"""
+        if not self._audit_batch:
+            return
+        
+        if not self.fast_audit:
+            batch, self._audit_batch = self._audit_batch, []
             try:
-                self.audit_logger.log(
-                    action_type=action_type,
-                    target=target,
-                    result=result,
-                    parameters=parameters or {},
-                    message=message or f"Ralph Loop: {action_type}"
-                )
+                self.audit_logger.log_many(batch)
             except Exception as e:
                 print(f"Warning: Audit log failed: {e}")
+            return
+        
+        # Group by day: each record goes to the same daily file AuditLogger
+        # uses, so its queries, summaries and retention cover fast mode too
+        by_day = {}
+        for record in self._audit_batch:
+            by_day.setdefault(record["date"].replace("-", ""), []).append(_encode_audit_record(record))
+        self._audit_batch.clear()
+        try:
+            for day, lines in by_day.items():
+                fd = self._day_audit_fd(day)
+                if hasattr(os, 'writev'):
+                    for i in range(0, len(lines), _IOV_MAX):
+                        os.writev(fd, lines[i:i + _IOV_MAX])
+                else:
+                    os.write(fd, b''.join(lines))
+        except OSError as e:
+            print(f"Warning: Audit log failed: {e}")
+    
+    def _day_audit_fd(self, day: str) -> int:
+        """Return an append-only fd for Logs/audit_<day>.jsonl, reopening when the day changes"""
+        if self._audit_fd_day != day:
+            self.close_audit()
+            self._audit_fd = os.open(self.logs_dir / f"audit_{day}.jsonl",
+                                     os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._audit_fd_day = day
+        return self._audit_fd
+    
+    def close_audit(self):
+        """Close the fast audit fd, if open (reopened on the next flush)"""
+        if self._audit_fd is not None:
+            os.close(self._audit_fd)
+            self._audit_fd = None
+            self._audit_fd_day = None
     
     def scan_needs_action(self) -> List[str]:
         """Scan /Needs_Action for files to process"""
@@ -106,24 +423,35 @@ class RalphWiggumLoop:
             return []
 
         # Get all files in Needs_Action (excluding hidden files)
-        files = [f for f in self.needs_action_dir.glob("*") if f.is_file() and not f.name.startswith('.')]
-        return sorted([str(f) for f in files])
+        return self._scan_dir(self.needs_action_dir, lambda name: not name.startswith('.'))
+    
+    @staticmethod
+    def _scan_dir(directory: Path, name_filter) -> List[str]:
+        """
+        List regular files in a directory whose names pass name_filter, sorted.
+        
+        DirEntry.is_file() is answered from the getdents d_type, so regular files
+        need no per-entry stat(); only symlinks (followed, so a link to a task
+        file is still picked up) and DT_UNKNOWN entries cost one. Names are
+        filtered before is_file() is consulted at all.
+        """
+        with os.scandir(directory) as entries:
+            return sorted(e.path for e in entries
+                          if name_filter(e.name) and e.is_file())
     
     def scan_pending_approval(self) -> List[str]:
         """Scan /Pending_Approval for files awaiting approval"""
         if not self.pending_approval_dir.exists():
             return []
         
-        files = [f for f in self.pending_approval_dir.glob("*.md") if f.is_file()]
-        return sorted([str(f) for f in files])
+        return self._scan_dir(self.pending_approval_dir, lambda name: name.endswith('.md'))
     
     def scan_approved(self) -> List[str]:
         """Scan /Approved for files ready for MCP execution"""
         if not self.approved_dir.exists():
             return []
         
-        files = [f for f in self.approved_dir.glob("*.md") if f.is_file()]
-        return sorted([str(f) for f in files])
+        return self._scan_dir(self.approved_dir, lambda name: name.endswith('.md'))
 
     def task_analyzer(self, file_path: str) -> Dict[str, Any]:
         """
@@ -137,16 +465,16 @@ class RalphWiggumLoop:
             dict: Task analysis results
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            content_lower = content.lower()
-            
-            # Extract metadata from frontmatter if present
-            metadata = self._parse_frontmatter(content)
-            
-            # Determine task type based on content and metadata
-            task_type = self._determine_task_type(content_lower, metadata)
+            with _map_file(file_path) as data:
+                # Extract metadata from frontmatter if present; only the head of a
+                # file with frontmatter is decoded, keyword matching uses raw bytes
+                metadata = {}
+                if data[:3] == b'---':
+                    metadata = self._parse_frontmatter(
+                        data[:_HEAD_BYTES].decode('utf-8', errors='ignore'))
+                
+                # Determine task type based on content and metadata
+                task_type = self._determine_task_type(data, metadata)
             
             # Determine if multi-step (requires HITL, MCP, etc.)
             is_multi_step = self._is_multi_step_task(task_type, metadata)
@@ -162,7 +490,6 @@ class RalphWiggumLoop:
                 'workflow': workflow,
                 'current_stage': 'analysis',
                 'metadata': metadata,
-                'content_preview': content[:500],
                 'priority': metadata.get('priority', 'normal'),
                 'platform': metadata.get('platform', 'unknown'),
                 'keyword': metadata.get('keyword', 'general')
@@ -184,7 +511,7 @@ class RalphWiggumLoop:
             return analysis
             
         except Exception as e:
-            print(f"Error analyzing {file_path}: {e}")
+            self._say(f"Error analyzing {file_path}: {e}")
             self.log_audit(
                 action_type="task_analysis_failed",
                 target=file_path,
@@ -218,7 +545,7 @@ class RalphWiggumLoop:
                 pass
         return metadata
     
-    def _determine_task_type(self, content: str, metadata: Dict) -> str:
+    def _determine_task_type(self, content: bytes, metadata: Dict) -> str:
         """Determine task type based on content and metadata"""
         # Check metadata first
         task_type = metadata.get('type', '')
@@ -226,197 +553,171 @@ class RalphWiggumLoop:
         if task_type:
             return task_type
         
-        # Fall back to content analysis
-        if any(kw in content for kw in ['sales', 'client', 'project']):
-            if 'facebook' in content or 'instagram' in content:
+        # Fall back to content analysis (matched case-insensitively)
+        keyword_class = _keyword_class(content)
+        if keyword_class == _LEAD:
+            if _FACEBOOK_INSTAGRAM_RE.search(content):
                 return 'facebook_instagram_lead'
-            elif 'twitter' in content:
+            elif _TWITTER_RE.search(content):
                 return 'twitter_lead'
-            elif 'linkedin' in content:
+            elif _LINKEDIN_RE.search(content):
                 return 'linkedin_lead'
             else:
                 return 'social_media_lead'
-        elif any(kw in content for kw in ['urgent', 'invoice', 'payment']):
+        elif keyword_class == _FINANCIAL:
             return 'financial_task'
-        elif any(kw in content for kw in ['meeting', 'schedule', 'calendar']):
+        elif keyword_class == _SCHEDULE:
             return 'schedule_task'
         else:
             return 'general_task'
     
-    def _is_multi_step_task(self, task_type: str, metadata: Dict) -> bool:
+    @staticmethod
+    def _is_multi_step_task(task_type: str, metadata: Dict) -> bool:
         """Determine if task requires multiple steps"""
-        multi_step_types = [
-            'facebook_instagram_lead', 'twitter_lead', 'linkedin_lead',
-            'social_media_lead', 'email_response_required'
-        ]
-        return task_type in multi_step_types
+        # Depends on task_type only, so the memoized lookup is keyed on it alone
+        return _is_multi_step_type(task_type)
     
-    def _build_workflow(self, task_type: str, metadata: Dict) -> List[str]:
+    @staticmethod
+    def _build_workflow(task_type: str, metadata: Dict) -> List[str]:
         """Build workflow stages for task type"""
-        # Default workflow for social media leads
-        if any(lead in task_type for lead in ['lead', 'social']):
-            return [
-                'analysis',
-                'skill_execution',  # Generate draft
-                'hitl_approval',    # Wait for approval
-                'mcp_execution',    # Execute via MCP
-                'audit_logging',
-                'completion'
-            ]
-        
-        # Financial tasks
-        if 'financial' in task_type:
-            return ['analysis', 'skill_execution', 'completion']
-        
-        # Schedule tasks
-        if 'schedule' in task_type:
-            return ['analysis', 'mcp_execution', 'completion']
-        
-        # Default
-        return ['analysis', 'completion']
+        return list(_workflow_for_type(task_type))
 
     def execute_task(self, task: Dict[str, Any]) -> bool:
         """
-        Execute task through workflow stages.
+        Advance a task through its workflow until it completes or must wait.
+        
+        The workflow runs as a generator stored on the task, so a task paused
+        at HITL approval resumes where it left off on the next iteration.
         
         Args:
             task: Task analysis dict
             
         Returns:
-            bool: True if task complete, False if requires further steps
+            bool: True if task complete, False if it is waiting for HITL approval
         """
-        print(f"\nExecuting task: {task['task_type']} for {task['file_name']}")
-        print(f"  Workflow: {' -> '.join(task['workflow'])}")
-        
-        current_stage = task.get('current_stage', 'analysis')
-        
-        # Execute based on current stage
-        if current_stage == 'analysis':
-            return self._execute_analysis_stage(task)
-        elif current_stage == 'skill_execution':
-            return self._execute_skill_stage(task)
-        elif current_stage == 'hitl_approval':
-            return self._execute_hitl_stage(task)
-        elif current_stage == 'mcp_execution':
-            return self._execute_mcp_stage(task)
-        elif current_stage == 'audit_logging':
-            return self._execute_audit_stage(task)
-        elif current_stage == 'completion':
-            return self._execute_completion_stage(task)
-        else:
-            print(f"  Unknown stage: {current_stage}")
+        self._say(f"\nExecuting task: {task['task_type']} for {task['file_name']}")
+        self._say(f"  Workflow: {' -> '.join(task['workflow'])}")
+        
+        if '_gen' not in task:
+            task['_gen'] = self._task_workflow(task)
+        
+        try:
+            next(task['_gen'])
+        except StopIteration:
             return True
+        return False
     
-    def _execute_analysis_stage(self, task: Dict) -> bool:
-        """Execute analysis stage"""
-        print(f"  Stage: Analysis")
-        print(f"  Task Type: {task['task_type']}")
-        print(f"  Multi-step: {task['is_multi_step']}")
+    def _task_workflow(self, task: Dict) -> Generator[str, None, None]:
+        """
+        Run workflow stages for a task, yielding 'hitl_wait' while approval is pending.
         
-        # Move to next stage
-        task['current_stage'] = 'skill_execution'
-        self.task_history.append({
-            'file': task['file_name'],
-            'stage': 'analysis',
-            'timestamp': datetime.now().isoformat(),
-            'result': 'complete'
-        })
+        Entry point depends on where the file was found: Needs_Action files start
+        at analysis, Pending_Approval at HITL, and Approved at MCP execution.
+        """
+        entry = task.get('current_stage', 'analysis')
+        
+        if entry == 'analysis':
+            self._stage_analysis(task)
+            needs_hitl = self._stage_skill(task)
+        else:
+            needs_hitl = entry == 'hitl_approval'
+        
+        if entry == 'analysis' and not needs_hitl:
+            self._stage_completion(task)
+            return
+        
+        if needs_hitl:
+            while not self._stage_hitl(task):
+                yield 'hitl_wait'
         
-        return False  # Continue to next stage
+        self._stage_mcp(task)
+        self._stage_audit(task)
+        self._stage_completion(task)
     
-    def _execute_skill_stage(self, task: Dict) -> bool:
-        """Execute skill execution stage (generate drafts, summaries, etc.)"""
-        print(f"  Stage: Skill Execution")
+    def _record_stage(self, task: Dict, stage: str, result: str):
+        """Append a stage transition to the task history"""
+        task['current_stage'] = stage
+        getattr(self._worker, 'history', self.task_history).append(StageEvent(
+            file=task['file_name'],
+            stage=stage,
+            ts_ns=time.time_ns(),
+            result=result
+        ))
+    
+    def _stage_analysis(self, task: Dict):
+        """Execute analysis stage"""
+        self._say(f"  Stage: Analysis")
+        self._say(f"  Task Type: {task['task_type']}")
+        self._say(f"  Multi-step: {task['is_multi_step']}")
+        
+        self._record_stage(task, 'analysis', 'complete')
+    
+    def _stage_skill(self, task: Dict) -> bool:
+        """
+        Execute skill execution stage (generate drafts, summaries, etc.)
         
-        task_type = task['task_type']
-        file_path = task['file_path']
+        Returns:
+            bool: True if a draft was created and HITL approval is required
+        """
+        self._say(f"  Stage: Skill Execution")
+        task['current_stage'] = 'skill_execution'
         
         # Trigger appropriate skill based on task type
-        skill_triggered = self._trigger_skill(task_type, file_path)
+        if not self._trigger_skill(task['task_type'], task['file_path']):
+            self._say(f"  Skill execution skipped")
+            return False
         
-        if skill_triggered:
-            print(f"  Skill triggered successfully")
-            
-            # Check if draft was created (move to Pending_Approval)
-            draft_created = self._check_draft_created(task)
-            
-            if draft_created:
-                print(f"  Draft created, moving to HITL approval")
-                task['current_stage'] = 'hitl_approval'
-                self.task_history.append({
-                    'file': task['file_name'],
-                    'stage': 'skill_execution',
-                    'timestamp': datetime.now().isoformat(),
-                    'result': 'draft_created'
-                })
-                return False  # Continue to HITL
-            else:
-                print(f"  No draft required, completing task")
-                task['current_stage'] = 'completion'
-                return False
-        else:
-            print(f"  Skill execution skipped")
-            task['current_stage'] = 'completion'
+        self._say(f"  Skill triggered successfully")
+        
+        # Check if draft was created (move to Pending_Approval)
+        if not self._check_draft_created(task):
+            self._say(f"  No draft required, completing task")
             return False
+        
+        self._say(f"  Draft created, moving to HITL approval")
+        self._record_stage(task, 'skill_execution', 'draft_created')
+        return True
     
-    def _execute_hitl_stage(self, task: Dict) -> bool:
-        """Execute HITL approval stage"""
-        print(f"  Stage: HITL Approval")
+    def _stage_hitl(self, task: Dict) -> bool:
+        """
+        Execute HITL approval stage
+        
+        Returns:
+            bool: True if approval has been granted
+        """
+        self._say(f"  Stage: HITL Approval")
         
         # Check if file has been approved (moved to /Approved)
-        is_approved = self._check_approval_status(task)
-        
-        if is_approved:
-            print(f"  Approval granted, proceeding to MCP execution")
-            task['current_stage'] = 'mcp_execution'
-            self.task_history.append({
-                'file': task['file_name'],
-                'stage': 'hitl_approval',
-                'timestamp': datetime.now().isoformat(),
-                'result': 'approved'
-            })
-            self.log_audit(
-                action_type="hitl_approved",
-                target=task['file_path'],
-                result="success",
-                message="HITL approval granted"
-            )
-            return False  # Continue to MCP
-        else:
-            print(f"  Awaiting HITL approval (file in Pending_Approval)")
-            self.task_history.append({
-                'file': task['file_name'],
-                'stage': 'hitl_approval',
-                'timestamp': datetime.now().isoformat(),
-                'result': 'pending'
-            })
-            return True  # Task not complete, waiting for approval
+        if not self._check_approval_status(task):
+            self._say(f"  Awaiting HITL approval (file in Pending_Approval)")
+            self._record_stage(task, 'hitl_approval', 'pending')
+            return False
+        
+        self._say(f"  Approval granted, proceeding to MCP execution")
+        self._record_stage(task, 'hitl_approval', 'approved')
+        self.log_audit(
+            action_type="hitl_approved",
+            target=task['file_path'],
+            result="success",
+            message="HITL approval granted"
+        )
+        return True
     
-    def _execute_mcp_stage(self, task: Dict) -> bool:
+    def _stage_mcp(self, task: Dict):
         """Execute MCP server stage"""
-        print(f"  Stage: MCP Execution")
+        self._say(f"  Stage: MCP Execution")
+        task['current_stage'] = 'mcp_execution'
         
         # Trigger MCP server if available
-        mcp_executed = self._trigger_mcp(task)
-        
-        if mcp_executed:
-            print(f"  MCP execution successful")
-            task['current_stage'] = 'audit_logging'
-            self.task_history.append({
-                'file': task['file_name'],
-                'stage': 'mcp_execution',
-                'timestamp': datetime.now().isoformat(),
-                'result': 'success'
-            })
-            return False  # Continue to audit logging
+        if self._trigger_mcp(task):
+            self._say(f"  MCP execution successful")
+            self._record_stage(task, 'mcp_execution', 'success')
         else:
-            print(f"  MCP execution skipped (not available or not required)")
-            task['current_stage'] = 'audit_logging'
-            return False
+            self._say(f"  MCP execution skipped (not available or not required)")
     
-    def _execute_audit_stage(self, task: Dict) -> bool:
+    def _stage_audit(self, task: Dict):
         """Execute audit logging stage"""
-        print(f"  Stage: Audit Logging")
+        self._say(f"  Stage: Audit Logging")
         
         # Log completion
         self.log_audit(
@@ -430,24 +731,16 @@ class RalphWiggumLoop:
             message=f"Task completed: {task['file_name']}"
         )
         
-        task['current_stage'] = 'completion'
-        self.task_history.append({
-            'file': task['file_name'],
-            'stage': 'audit_logging',
-            'timestamp': datetime.now().isoformat(),
-            'result': 'logged'
-        })
-        
-        return False  # Continue to completion
+        self._record_stage(task, 'audit_logging', 'logged')
     
-    def _execute_completion_stage(self, task: Dict) -> bool:
+    def _stage_completion(self, task: Dict):
         """Execute completion stage (move files, cleanup)"""
-        print(f"  Stage: Completion")
+        self._say(f"  Stage: Completion")
         
         # Move file to Done
         self._move_to_done(task['file_path'])
         
-        print(f"  TASK_COMPLETE: {task['file_name']}")
+        self._say(f"  TASK_COMPLETE: {task['file_name']}")
         
         self.log_audit(
             action_type="task_finalized",
@@ -456,14 +749,7 @@ class RalphWiggumLoop:
             message=f"Moved to Done: {task['file_name']}"
         )
         
-        self.task_history.append({
-            'file': task['file_name'],
-            'stage': 'completion',
-            'timestamp': datetime.now().isoformat(),
-            'result': 'TASK_COMPLETE'
-        })
-        
-        return True  # Task complete
+        self._record_stage(task, 'completion', 'TASK_COMPLETE')
     
     def _trigger_skill(self, task_type: str, file_path: str) -> bool:
         """Trigger appropriate skill based on task type"""
@@ -480,7 +766,7 @@ class RalphWiggumLoop:
         skill = skills_to_trigger.get(task_type)
         
         if skill:
-            print(f"  Triggering skill: {skill}")
+            self._say(f"  Triggering skill: {skill}")
             # In production, this would call the actual skill
             # For demo, we simulate the draft creation
             self._simulate_skill_execution(skill, file_path)
@@ -498,46 +784,26 @@ class RalphWiggumLoop:
             return
         
         # Create draft in Pending_Approval
-        draft_name = f"draft_{Path(file_path).name}"
+        draft_name = f"draft_{os.path.basename(file_path)}"
         draft_path = self.pending_approval_dir / draft_name
         
-        draft_content = f"""---
-type: skill_draft
-source_file: {file_path}
-skill: {skill}
-status: pending_approval
-created: {datetime.now().isoformat()}
-requires_hitl: true
----
-
-# Draft Generated by {skill}
-
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-**Source:** {Path(file_path).name}
-
----
-
-## Draft Content
-
-[Skill would generate content here]
-
----
-
-## Action Required
-
-- [ ] Review and edit if needed
-- [ ] Move to /Approved to execute
-- [ ] Or move to /Rejected if not appropriate
-
----
-*Generated by Ralph Wiggum Loop (Gold Tier)*
-*Requires HITL approval*
-"""
+        now = datetime.now()
+        payload = _DRAFT_TEMPLATE.format_map({
+            'source': file_path,
+            'skill': skill,
+            'iso': now.isoformat(),
+            'human': now.strftime('%Y-%m-%d %H:%M:%S'),
+            'name': os.path.basename(file_path)
+        }).encode('utf-8')
         
-        with open(draft_path, 'w', encoding='utf-8') as f:
-            f.write(draft_content)
+        # Single write syscall for the whole draft
+        fd = os.open(draft_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
         
-        print(f"  Draft created: {draft_path}")
+        self._say(f"  Draft created: {draft_path}")
     
     def _check_draft_created(self, task: Dict) -> bool:
         """Check if draft was created in Pending_Approval"""
@@ -556,22 +822,145 @@ requires_hitl: true
     def _trigger_mcp(self, task: Dict) -> bool:
         """Trigger MCP server execution"""
         # This would integrate with actual MCP servers
-        print(f"  MCP execution simulated")
+        self._say(f"  MCP execution simulated")
         return True  # Simulate success
     
     def _move_to_done(self, file_path: str):
-        """Move file to Done directory"""
+        """Queue file for moving to the Done directory (flushed by _batch_move)"""
+        dest_path = self.done_dir / os.path.basename(file_path)
+        getattr(self._worker, 'moves', self._pending_moves).append((file_path, str(dest_path)))
+    
+    def _batch_move(self, pairs: List[tuple]) -> List[tuple]:
+        """
+        Rename (src, dest) pairs, batched through io_uring when available.
+        
+        Any pair the batch could not rename is retried with os.replace, which
+        is also the path used when liburing is missing or on non-Linux systems.
+        
+        Returns:
+            list: Pairs whose source is still in place (the move failed)
+        """
+        if not pairs:
+            return []
+        
+        failed = pairs
+        if self._uring_ok and len(pairs) > 1:
+            try:
+                failed = []
+                for i in range(0, len(pairs), _URING_BATCH):
+                    failed.extend(self._uring_rename(pairs[i:i + _URING_BATCH]))
+            except (AttributeError, TypeError, OSError) as e:
+                # Binding mismatch or io_uring blocked (e.g. by seccomp): stop trying
+                print(f"Warning: io_uring batch move failed, using os.replace from now on: "
+                      f"{type(e).__name__}: {e}")
+                self._uring_ok = False
+                failed = [p for p in pairs if os.path.exists(p[0])]
+        
+        unmoved = []
+        for src, dest in failed:
+            try:
+                os.replace(src, dest)
+                print(f"  Moved to Done: {dest}")
+            except FileNotFoundError:
+                pass  # Already moved or removed externally
+            except OSError as e:
+                print(f"  Error moving file: {e}")
+                unmoved.append((src, dest))
+        return unmoved
+    
+    @staticmethod
+    def _uring_rename(pairs: List[tuple]) -> List[tuple]:
+        """Submit one IORING_OP_RENAMEAT per pair in a single submit; return failed pairs"""
+        ring = liburing.Ring()
+        cqe = liburing.Cqe()
+        # The SQEs point into these strings, so they must outlive the completions
+        paths = [(os.path.abspath(src), os.path.abspath(dest)) for src, dest in pairs]
+        liburing.io_uring_queue_init(len(pairs), ring)
         try:
-            if Path(file_path).exists():
-                dest_path = self.done_dir / Path(file_path).name
-                shutil.move(file_path, dest_path)
-                print(f"  Moved to Done: {dest_path}")
-        except Exception as e:
-            print(f"  Error moving file: {e}")
+            for i, (src, dest) in enumerate(paths):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_rename(sqe, src, dest)
+                liburing.io_uring_sqe_set_data64(sqe, i)
+            liburing.io_uring_submit(ring)
+            
+            failed = []
+            for _ in pairs:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                entry = cqe[0]
+                index = liburing.io_uring_cqe_get_data64(entry)
+                try:
+                    entry.res  # Raises the rename's OSError for a negative result
+                    print(f"  Moved to Done: {pairs[index][1]}")
+                except OSError:
+                    failed.append(pairs[index])
+                finally:
+                    liburing.io_uring_cqe_seen(ring, entry)
+            return failed
+        finally:
+            liburing.io_uring_queue_exit(ring)
+
+    def _wait_for_changes(self):
+        """Block until a workflow directory changes (or timeout), instead of spinning"""
+        if self._inotify is not None:
+            events = self._inotify.read(timeout=self.IDLE_WAIT_TIMEOUT_MS)
+            if not events:
+                print(f"\nNo filesystem changes in {self.IDLE_WAIT_TIMEOUT_MS // 1000}s, re-checking")
+        else:
+            time.sleep(1)
+
+    def _process_one(self, file_info: Dict[str, Any]) -> TaskOutcome:
+        """
+        Advance one file through its workflow (may run on a worker thread).
+        
+        Nothing shared is touched here: progress output, audit records, moves
+        and stage history are collected into the returned outcome, and
+        _apply_outcome merges them on the main thread.
+        
+        Args:
+            file_info: Scan entry with 'path' and 'stage'
+            
+        Returns:
+            TaskOutcome: The task and everything its step produced
+        """
+        file_path = file_info['path']
+        worker = self._worker
+        worker.output, worker.audit, worker.moves, worker.history = [], [], [], []
+        try:
+            self._say(f"\nProcessing: {Path(file_path).name} (Stage: {file_info['stage']})")
+            
+            # Resume an in-flight task, or analyze a newly seen file
+            task = self._tasks.get(file_path)
+            started = task is None
+            if started:
+                task = self.task_analyzer(file_path)
+                task['current_stage'] = file_info['stage']
+            
+            # Execute the task through workflow
+            complete = self.execute_task(task)
+            return TaskOutcome(task, started, complete, worker.output,
+                               worker.audit, worker.moves, worker.history)
+        finally:
+            del worker.output, worker.audit, worker.moves, worker.history
+    
+    def _apply_outcome(self, file_path: str, outcome: TaskOutcome):
+        """Print a file's buffered output and merge its results (main thread only)"""
+        for line in outcome.output:
+            print(line)
+        self._audit_batch.extend(outcome.audit)
+        self._pending_moves.extend(outcome.moves)
+        self.task_history.extend(outcome.history)
+        if outcome.complete:
+            self._tasks.pop(file_path, None)
+        else:
+            self._tasks[file_path] = outcome.task
 
     def run_iteration(self) -> bool:
         """Run a single iteration of the loop"""
         self.iteration_count += 1
+        
+        # Discard queued events; anything arriving from here on wakes the next wait
+        if self._inotify is not None:
+            self._inotify.read(timeout=0)
         print(f"\n{'='*60}")
         print(f"--- Ralph Wiggum Loop - Iteration {self.iteration_count}/{self.max_iterations} ---")
         print(f"{'='*60}")
@@ -606,8 +995,15 @@ requires_hitl: true
                 'stage': 'analysis'
             })
         
+        # Forget in-flight tasks whose files were moved away externally
+        seen_paths = {info['path'] for info in files_to_process}
+        for stale in [p for p in self._tasks if p not in seen_paths]:
+            del self._tasks[stale]
+        
         if not files_to_process:
+            self._idle_iteration = False
             print("\nNo files to process in any directory")
+            self.flush_audit()
             return True  # Nothing to do
 
         print(f"\nFound {len(files_to_process)} files to process")
@@ -615,38 +1011,54 @@ requires_hitl: true
         # Process each file
         tasks_completed = 0
         tasks_pending = 0
+        tasks_started = 0
+        self._remaining = len(files_to_process)
         
-        for file_info in files_to_process:
-            file_path = file_info['path']
-            print(f"\nProcessing: {Path(file_path).name} (Stage: {file_info['stage']})")
-            
-            # Analyze the task
-            task = self.task_analyzer(file_path)
-            task['current_stage'] = file_info['stage']
-            
-            # Execute the task through workflow
-            task_complete = self.execute_task(task)
-            
-            if task_complete:
-                tasks_completed += 1
+        # Files are independent, so overlap their reads and writes across a pool;
+        # results are printed and merged here, in scan order, as they come back
+        with contextlib.ExitStack() as stack:
+            if len(files_to_process) <= 2:
+                outcomes = map(self._process_one, files_to_process)
             else:
-                tasks_pending += 1
+                pool = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(files_to_process))))
+                outcomes = pool.map(self._process_one, files_to_process)
+            
+            for file_info, outcome in zip(files_to_process, outcomes):
+                self._apply_outcome(file_info['path'], outcome)
+                if outcome.started:
+                    tasks_started += 1
+                if outcome.complete:
+                    tasks_completed += 1
+                else:
+                    tasks_pending += 1
+        
+        # Apply this iteration's moves to Done in one batch; a completed file
+        # only stops counting as remaining once it has actually been moved
+        unmoved = self._batch_move(self._pending_moves)
+        self._pending_moves = []
+        self._remaining -= tasks_completed - len(unmoved)
+        
+        # Every task is parked at HITL: only a filesystem change can make progress
+        self._idle_iteration = tasks_started == 0 and tasks_completed == 0
         
         print(f"\n--- Iteration Summary ---")
         print(f"Tasks Completed: {tasks_completed}")
         print(f"Tasks Pending: {tasks_pending}")
         
-        # Check if all tasks are complete
-        all_complete = (tasks_pending == 0 and 
-                       len(self.scan_needs_action()) == 0 and
-                       len(self.scan_pending_approval()) == 0)
+        self.flush_audit()
         
-        if all_complete:
+        # Check if all tasks are complete
+        if self.check_completion_promise():
             print("\n✓ All tasks completed!")
             return True
         
         return False  # Continue loop
 
+    def check_completion_promise(self) -> bool:
+        """All files seen in the last iteration completed (and were moved out)"""
+        return self._remaining == 0
+
     def run(self, prompt: str = None) -> bool:
         """
         Run the Ralph Wiggum reasoning loop.
@@ -697,8 +1109,13 @@ requires_hitl: true
                     },
                     message="Ralph Wiggum Loop completed"
                 )
+                self.flush_audit()
                 
                 return True
+            
+            # Nothing new to do (e.g. awaiting HITL): sleep until the filesystem changes
+            if self._idle_iteration and i < self.max_iterations - 1:
+                self._wait_for_changes()
         
         print("\n" + "="*60)
         print(f"WARNING: Reached maximum iterations ({self.max_iterations})")
@@ -715,10 +1132,11 @@ requires_hitl: true
             },
             message=f"Loop ended after {self.max_iterations} iterations"
         )
+        self.flush_audit()
         
         return False
     
-    def get_task_history(self) -> List[Dict]:
+    def get_task_history(self) -> List[StageEvent]:
         """Get task processing history"""
         return self.task_history
     
@@ -732,9 +1150,8 @@ requires_hitl: true
         
         # Count by stage
         stages = {}
-        for task in self.task_history:
-            stage = task.get('stage', 'unknown')
-            stages[stage] = stages.get(stage, 0) + 1
+        for event in self.task_history:
+            stages[event.stage] = stages.get(event.stage, 0) + 1
         
         print("\nTasks by Stage:")
         for stage, count in sorted(stages.items()):
@@ -742,9 +1159,8 @@ requires_hitl: true
         
         # Count by result
         results = {}
-        for task in self.task_history:
-            result = task.get('result', 'unknown')
-            results[result] = results.get(result, 0) + 1
+        for event in self.task_history:
+            results[event.result] = results.get(event.result, 0) + 1
         
         print("\nTasks by Result:")
         for result, count in sorted(results.items()):
@@ -773,6 +1189,8 @@ Examples:
                        help='Maximum number of iterations (default: 20 for Gold Tier)')
     parser.add_argument('--no-audit', action='store_true',
                        help='Disable audit logging')
+    parser.add_argument('--fast-audit', action='store_true',
+                       help='Batch audit records into the daily audit log (one write per iteration)')
 
     args = parser.parse_args()
 
@@ -782,10 +1200,14 @@ Examples:
 
     loop = RalphWiggumLoop(
         max_iterations=args.max_iterations,
-        audit_enabled=not args.no_audit
+        audit_enabled=not args.no_audit,
+        fast_audit=args.fast_audit
     )
     
-    success = loop.run(prompt=args.prompt)
+    try:
+        success = loop.run(prompt=args.prompt)
+    finally:
+        loop.close_audit()
     loop.print_summary()
     
     # Exit with appropriate code
@@ -1,16 +1,31 @@
 """
 Audit Logger Utility (Gold Tier)
 Logs every action with timestamp, action_type, actor, target, parameters, approval_status, result
+Entries are appended as JSON Lines (one file per day: Logs/audit_YYYYMMDD.jsonl)
 Retains logs for 90 days with automatic cleanup
 Generates weekly summaries for CEO Briefing
 """
 
 import os
 import json
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+# Compact one-line entry encoding; orjson (C, emits bytes directly) when available
+try:
+    import orjson
+
+    def _encode_entry(entry: Dict[str, Any]) -> bytes:
+        return orjson.dumps(entry)
+except ImportError:
+    def _encode_entry(entry: Dict[str, Any]) -> bytes:
+        return json.dumps(entry, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
 
 class AuditLogger:
@@ -19,6 +34,9 @@ class AuditLogger:
     # Log retention period in days
     RETENTION_DAYS = 90
     
+    # Minimum seconds between retention sweeps (shared across processes via a marker file)
+    CLEANUP_INTERVAL = 24 * 60 * 60
+    
     def __init__(self, base_dir=None):
         """
         Initialize audit logger.
@@ -45,8 +63,10 @@ class AuditLogger:
         # Default actor (can be overridden per action)
         self.default_actor = "AI_Employee_System"
         
-        # Cleanup old logs on initialization
-        self.cleanup_old_logs()
+        # Convert any legacy JSON-array logs; the retention sweep runs at most
+        # daily and off the constructor's critical path
+        self.migrate_json_logs()
+        threading.Thread(target=self._cleanup_if_due, daemon=True).start()
     
     def _get_audit_log_path(self, date=None):
         """
@@ -62,7 +82,7 @@ class AuditLogger:
             date = datetime.now()
         
         date_str = date.strftime("%Y%m%d")
-        return self.logs_dir / f"audit_{date_str}.json"
+        return self.logs_dir / f"audit_{date_str}.jsonl"
     
     def log(self, action_type: str, target: str, parameters: Optional[Dict[str, Any]] = None,
             approval_status: str = "not_required", result: str = "success",
@@ -84,13 +104,14 @@ class AuditLogger:
         Returns:
             str: Path to the log file
         """
-        timestamp = datetime.now().isoformat()
-        date = datetime.now()
+        # One clock read covers the timestamp, the date field and the file name
+        now = datetime.now()
+        timestamp = now.isoformat()
         
         # Build log entry
         log_entry = {
             "timestamp": timestamp,
-            "date": date.strftime("%Y-%m-%d"),
+            "date": timestamp[:10],
             "action_type": action_type,
             "actor": actor or self.default_actor,
             "target": target,
@@ -105,32 +126,55 @@ class AuditLogger:
             log_entry["metadata"] = metadata
         
         # Write to log file
-        log_path = self._get_audit_log_path(date)
+        log_path = self._get_audit_log_path(now)
         
+        # Append one line; no need to read or rewrite earlier entries
+        line = _encode_entry(log_entry) + b"\n"
         with self._lock:
-            # Read existing entries
-            entries = []
-            if log_path.exists():
-                try:
-                    with open(log_path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                        if content:
-                            # Handle potential trailing comma issues
-                            if content.startswith('[') and content.endswith(']'):
-                                entries = json.loads(content)
-                            elif content.startswith('['):
-                                # Try to parse as array with potential issues
-                                entries = json.loads(content.rstrip(',') + ']')
-                except (json.JSONDecodeError, Exception) as e:
-                    # If file is corrupted, start fresh
-                    entries = []
-            
-            # Append new entry
-            entries.append(log_entry)
+            with open(log_path, 'ab') as f:
+                f.write(line)
+        
+        return str(log_path)
+    
+    def log_many(self, entries: Iterable[Dict[str, Any]]):
+        """
+        Log several actions with a single timestamp and a single write.
+        
+        Args:
+            entries: Iterable of dicts accepting the same keys as log()
+                     (action_type, target, parameters, approval_status,
+                     result, actor, message, metadata)
             
-            # Write back
-            with open(log_path, 'w', encoding='utf-8') as f:
-                json.dump(entries, f, indent=2, ensure_ascii=False)
+        Returns:
+            str: Path to the log file
+        """
+        now = datetime.now()
+        timestamp = now.isoformat()
+        date_str = timestamp[:10]
+        
+        lines = []
+        for entry in entries:
+            log_entry = {
+                "timestamp": timestamp,
+                "date": date_str,
+                "action_type": entry["action_type"],
+                "actor": entry.get("actor") or self.default_actor,
+                "target": entry["target"],
+                "parameters": entry.get("parameters") or {},
+                "approval_status": entry.get("approval_status", "not_required"),
+                "result": entry.get("result", "success"),
+                "message": entry.get("message") or ""
+            }
+            if entry.get("metadata"):
+                log_entry["metadata"] = entry["metadata"]
+            lines.append(_encode_entry(log_entry))
+        
+        log_path = self._get_audit_log_path(now)
+        if lines:
+            payload = b"\n".join(lines) + b"\n"
+            with self._lock:
+                with open(log_path, 'ab') as f:
+                    f.write(payload)
         
         return str(log_path)
     
@@ -235,6 +279,32 @@ class AuditLogger:
             metadata=metadata
         )
     
+    @staticmethod
+    def _load_day(log_path) -> list:
+        """
+        Read every entry from one daily log file.
+        
+        Args:
+            log_path: Path to an audit_YYYYMMDD.jsonl file
+            
+        Returns:
+            list: Log entries; torn or invalid lines (e.g. from an interrupted
+                append) are skipped, and the lines after them still read
+        """
+        entries = []
+        try:
+            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except OSError:
+            pass
+        return entries
+    
     def get_logs_for_date_range(self, start_date: datetime, end_date: datetime) -> list:
         """
         Get all logs for a date range.
@@ -244,27 +314,32 @@ class AuditLogger:
             end_date: End date
             
         Returns:
-            list: List of log entries
+            list: List of log entries, oldest first
         """
-        all_logs = []
-        current_date = start_date
-        
-        while current_date <= end_date:
-            log_path = self._get_audit_log_path(current_date)
-            
-            if log_path.exists():
-                try:
-                    with open(log_path, 'r', encoding='utf-8') as f:
-                        entries = json.load(f)
-                        all_logs.extend(entries)
-                except (json.JSONDecodeError, Exception):
-                    pass
-            
-            current_date += timedelta(days=1)
-        
-        # Sort by timestamp
+        # One directory listing instead of an exists() check per day;
+        # YYYYMMDD names compare chronologically as plain strings
+        first = start_date.strftime("%Y%m%d")
+        last = end_date.strftime("%Y%m%d")
+        with os.scandir(self.logs_dir) as it:
+            log_paths = sorted(
+                entry.path for entry in it
+                if entry.name.startswith("audit_") and entry.name.endswith(".jsonl")
+                and first <= entry.name[6:14] <= last
+            )
+        
+        # Day files are independent; overlap their reads for multi-day ranges
+        if len(log_paths) <= 2:
+            day_lists = map(self._load_day, log_paths)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(log_paths))) as pool:
+                day_lists = list(pool.map(self._load_day, log_paths))
+        
+        # Days are visited in date order, but within a day the write order can
+        # differ from timestamp order (several writers append to the same file,
+        # and log_many stamps at flush time). The concatenation is nearly
+        # sorted, which timsort handles in close to linear time
+        all_logs = list(chain.from_iterable(day_lists))
         all_logs.sort(key=lambda x: x.get('timestamp', ''))
-        
         return all_logs
     
     def generate_summary(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
@@ -280,78 +355,119 @@ class AuditLogger:
         """
         logs = self.get_logs_for_date_range(start_date, end_date)
         
+        # Counter(iterable) does the counting in C
+        by_result = Counter(log.get('result', 'unknown') for log in logs)
+        by_action_type = Counter(log.get('action_type', 'unknown') for log in logs)
+        by_approval_status = Counter(log.get('approval_status', 'unknown') for log in logs)
+        by_actor = Counter(log.get('actor', 'unknown') for log in logs)
+        
         summary = {
             "period": {
                 "start": start_date.strftime("%Y-%m-%d"),
                 "end": end_date.strftime("%Y-%m-%d")
             },
             "total_actions": len(logs),
-            "by_result": {},
-            "by_action_type": {},
-            "by_approval_status": {},
-            "by_actor": {},
-            "errors": [],
-            "approvals_pending": 0,
-            "approvals_approved": 0,
-            "approvals_rejected": 0
-        }
-        
-        for log in logs:
-            # Count by result
-            result = log.get('result', 'unknown')
-            summary['by_result'][result] = summary['by_result'].get(result, 0) + 1
-            
-            # Count by action type
-            action_type = log.get('action_type', 'unknown')
-            summary['by_action_type'][action_type] = summary['by_action_type'].get(action_type, 0) + 1
-            
-            # Count by approval status
-            approval = log.get('approval_status', 'unknown')
-            summary['by_approval_status'][approval] = summary['by_approval_status'].get(approval, 0) + 1
-            
-            # Count by actor
-            actor = log.get('actor', 'unknown')
-            summary['by_actor'][actor] = summary['by_actor'].get(actor, 0) + 1
-            
-            # Track errors
-            if result == 'failed':
-                summary['errors'].append({
+            "by_result": dict(by_result),
+            "by_action_type": dict(by_action_type),
+            "by_approval_status": dict(by_approval_status),
+            "by_actor": dict(by_actor),
+            "errors": [
+                {
                     'timestamp': log.get('timestamp'),
-                    'action_type': action_type,
+                    'action_type': log.get('action_type', 'unknown'),
                     'target': log.get('target'),
                     'message': log.get('message', 'Unknown error')
-                })
-            
-            # Track approvals
-            if approval == 'pending':
-                summary['approvals_pending'] += 1
-            elif approval == 'approved':
-                summary['approvals_approved'] += 1
-            elif approval == 'rejected':
-                summary['approvals_rejected'] += 1
+                }
+                for log in logs if log.get('result', 'unknown') == 'failed'
+            ],
+            "approvals_pending": by_approval_status['pending'],
+            "approvals_approved": by_approval_status['approved'],
+            "approvals_rejected": by_approval_status['rejected']
+        }
         
         return summary
     
+    def _cleanup_if_due(self):
+        """Run cleanup_old_logs unless another run happened within CLEANUP_INTERVAL."""
+        marker = self.logs_dir / ".last_cleanup"
+        try:
+            if time.time() - marker.stat().st_mtime < self.CLEANUP_INTERVAL:
+                return
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return
+        
+        # Record the sweep only once it has finished, so a process that exits
+        # mid-sweep leaves it due; an overlapping sweep elsewhere is harmless
+        try:
+            self.cleanup_old_logs()
+            marker.touch()
+        except OSError:
+            pass
+    
     def cleanup_old_logs(self):
         """Delete audit logs older than RETENTION_DAYS."""
         cutoff_date = datetime.now() - timedelta(days=self.RETENTION_DAYS)
+        # audit_YYYYMMDD sorts chronologically, so compare names instead of parsing dates
+        cutoff_name = cutoff_date.strftime("audit_%Y%m%d")
         deleted_count = 0
         
-        for log_file in self.logs_dir.glob("audit_*.json"):
+        with os.scandir(self.logs_dir) as it:
+            for entry in it:
+                # audit_YYYYMMDD.jsonl, or legacy .json
+                name = entry.name
+                if (name.startswith("audit_") and name[6:14].isdigit()
+                        and name[14:] in (".jsonl", ".json") and name[:14] <= cutoff_name):
+                    try:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                    except OSError:
+                        pass
+        
+        return deleted_count
+    
+    def migrate_json_logs(self):
+        """
+        Convert legacy audit_YYYYMMDD.json array files to JSON Lines.
+        
+        Entries from the legacy file are placed before any lines already
+        written to the day's .jsonl file; the legacy file is then removed.
+        
+        Returns:
+            int: Number of files migrated
+        """
+        migrated_count = 0
+        
+        for legacy_path in self.logs_dir.glob("audit_*.json"):
             try:
-                # Extract date from filename (audit_YYYYMMDD.json)
-                filename = log_file.name
-                date_str = filename.replace('audit_', '').replace('.json', '')
-                file_date = datetime.strptime(date_str, "%Y%m%d")
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    content = f.read().strip()
+                try:
+                    entries = json.loads(content) if content else []
+                except json.JSONDecodeError:
+                    # Array cut off after a trailing comma by an interrupted write
+                    entries = json.loads(content.rstrip(' ,\n') + ']')
                 
-                if file_date < cutoff_date:
-                    log_file.unlink()
-                    deleted_count += 1
-            except (ValueError, Exception) as e:
-                # Skip files that don't match the pattern
+                jsonl_path = legacy_path.with_suffix('.jsonl')
+                existing = b""
+                if jsonl_path.exists():
+                    with open(jsonl_path, 'rb') as f:
+                        existing = f.read()
+                
+                with self._lock:
+                    with open(jsonl_path, 'wb') as f:
+                        for entry in entries:
+                            f.write(_encode_entry(entry) + b"\n")
+                        f.write(existing)
+                
+                legacy_path.unlink()
+                migrated_count += 1
+            except (json.JSONDecodeError, Exception):
+                # Leave unreadable files in place for manual review
                 pass
         
-        return deleted_count
+        return migrated_count
     
     def get_weekly_summary_for_briefing(self) -> str:
         """
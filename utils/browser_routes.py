@@ -0,0 +1,28 @@
+"""
+Browser Request Filtering for Gold Tier Watchers
+Aborts the heavy assets (images, fonts, video) the watchers never read.
+"""
+
+
+# Playwright resource types aborted by block_heavy_assets. Matching on the type
+# rather than a URL glob also catches CDN media URLs that carry no file
+# extension or end in a query string (fbcdn, cdninstagram, media.licdn.com)
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+
+async def _filter_request(route):
+    """Abort a request for a blocked resource type; let everything else through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_heavy_assets(context):
+    """
+    Abort image, font and media requests on every page of a browser context.
+    
+    Args:
+        context: Playwright BrowserContext (or Page)
+    """
+    await context.route('**/*', _filter_request)
@@ -5,15 +5,144 @@ Provides exponential backoff retry, error logging, and graceful degradation.
 
 import os
 import time
+import random
+import atexit
 import asyncio
-from datetime import datetime
+import threading
+import queue
+import logging
+from collections import deque
 from pathlib import Path
 from functools import wraps
+from concurrent.futures import Future
+
+
+# Retry diagnostics; with no logging configured, WARNING+ still reaches stderr
+_log = logging.getLogger(__name__)
+
+# At most this many retry messages per second are logged; the rest are dropped
+_RETRY_LOG_BURST = 10
+
+# Flags for error log fds: O_APPEND makes each write land atomically at the end,
+# even with other processes appending to the same file
+_APPEND_FLAGS = (os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                 | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+
+# Slots in the direct-mapped log path and fd caches; components that collide
+# just take the slow path, so memory and open fds stay bounded
+_CACHE_SLOTS = 128
+
+# Report templates, rendered with str.format_map
+_SKILL_ERROR_TEMPLATE = """---
+type: skill_error
+skill: {skill_name}
+timestamp: {timestamp}
+error_type: {error_type}
+status: needs_review
+---
+
+# Skill Error Report
+
+**Skill:** {skill_name}  
+**Timestamp:** {timestamp}  
+**Error Type:** {error_type}
+
+---
+
+## Error Details
+
+```
+{error_msg}
+```
+
+{input_section}{recovery_section}## Manual Review Required
+
+- [ ] Review error details above
+- [ ] Check input data for issues
+- [ ] Retry the operation manually
+- [ ] Update skill to handle this edge case
+- [ ] Move to /Done after resolution
+
+---
+*Generated by Error Recovery System (Gold Tier)*
+"""
+
+_MANUAL_ACTION_TEMPLATE = """---
+type: manual_action
+skill: {skill_name}
+action_type: {action_type}
+created: {timestamp}
+status: pending
+priority: high
+---
+
+# Manual Action Required
+
+**Skill:** {skill_name}  
+**Action Type:** {action_type}  
+**Created:** {timestamp}  
+**Status:** Pending Manual Execution
+
+---
+
+## Description
+
+{description}
+
+---
+
+## Original Input
+
+{original_input}
+---
+
+## Manual Execution Steps
+
+1. Review the description above
+2. Gather any necessary information
+3. Execute the {action_type} manually
+4. Document the outcome below
+5. Move this file to /Done after completion
+
+---
+
+## Outcome (Fill after execution)
+
+**Executed At:** _______________  
+**Executed By:** _______________  
+**Result:** _______________
+
+**Notes:**
+
+---
+*Generated by Error Recovery System (Gold Tier)*
+*Skill failed to execute automatically - manual intervention required*
+"""
+
+
+def _fmt_day(t):
+    """Format a struct_time's date as ("YYYY-MM-DD", "YYYYMMDD") without strftime."""
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}",
+            f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}")
+
+
+def _format_input(data, limit):
+    """Render input data as a Markdown list (dict) or a truncated block (str)."""
+    if isinstance(data, dict):
+        return "".join(f"- **{key}:** {value}\n" for key, value in data.items())
+    if isinstance(data, str):
+        return f"{data[:limit]}\n"
+    return ""
 
 
 class ErrorRecovery:
     """Utility class for error recovery across watchers and skills."""
     
+    # Error log buffering: flush once this many bytes are pending, or when
+    # this many seconds have passed since the last flush
+    _FLUSH_BYTES = 64 * 1024
+    _FLUSH_SECS = 2.0
+    
     def __init__(self, base_dir=None):
         """
         Initialize error recovery utility.
@@ -31,43 +160,132 @@ class ErrorRecovery:
         self.errors_dir = base_dir / "Errors"
         self.plans_dir = base_dir / "Plans"
         
-        # Ensure directories exist
-        self.logs_dir.mkdir(exist_ok=True)
-        self.errors_dir.mkdir(exist_ok=True)
-        self.plans_dir.mkdir(exist_ok=True)
+        # Ensure directories exist; the marker (kept inside Logs/, so it never
+        # lands in the project root) skips the mkdirs on later starts. The
+        # writer recreates a directory that has since been removed.
+        marker = self.logs_dir / ".errecov_init"
+        if not marker.exists():
+            self.logs_dir.mkdir(exist_ok=True)
+            self.errors_dir.mkdir(exist_ok=True)
+            self.plans_dir.mkdir(exist_ok=True)
+            marker.touch()
+        
+        # Plain-string dirs, and (component, date_str, path) slots for the
+        # current day's error logs, so hot paths skip Path construction
+        self._logs_dir_str = os.fspath(self.logs_dir)
+        self._errors_dir_str = os.fspath(self.errors_dir)
+        self._plans_dir_str = os.fspath(self.plans_dir)
+        self._path_slots = [None] * _CACHE_SLOTS
         
         # Retry configuration
         self.max_retries = 3
         self.base_delay = 1  # seconds
         self.max_delay = 60  # seconds
         self.exponential_base = 2
+        self.jitter = 0.5  # delays are stretched by a random factor in [1, 1 + jitter]
+        
+        # Error log filtering: None logs every component; ERRRECOV_COMPONENTS=a,b limits it
+        components = os.environ.get("ERRRECOV_COMPONENTS")
+        self.enabled_components = (
+            {name.strip() for name in components.split(",") if name.strip()}
+            if components else None
+        )
+        self.min_level = logging.NOTSET
+        
+        # Errors the decorators re-raise at once instead of retrying. Empty by
+        # default so every exception in `exceptions` is retried; callers opt in
+        # per decorator (e.g. unrecoverable=(TypeError,)) or by setting this
+        self.unrecoverable = ()
+        
+        # Times of the last _RETRY_LOG_BURST retry messages (rate limit)
+        self._retry_log_times = deque(maxlen=_RETRY_LOG_BURST)
+        
+        # Background writer: callers enqueue rendered bytes and return at once;
+        # the writer thread alone owns the buffers and open log fds
+        self._write_q = queue.SimpleQueue()
+        self._buffers = {}
+        self._fd_slots = [None] * _CACHE_SLOTS  # (log_file, fd)
+        self._last_flush = 0.0
+        self._handles_day = None
+        threading.Thread(target=self._writer_loop, name="error-recovery-writer",
+                         daemon=True).start()
+        atexit.register(self.close)
+        
+        # (epoch second, "YYYY-MM-DD HH:MM:SS", "YYYYMMDD_HHMMSS") for the last formatted second
+        self._ts_cache = (0, "", "")
+        # ((tm_year, tm_yday), "YYYY-MM-DD", "YYYYMMDD") for the current local day
+        self._day_cache = (None, "", "")
+    
+    def _timestamps(self):
+        """
+        Get the display timestamp and file-name stamp for the current second.
+        
+        Formatting is done at most once per second; repeated calls within
+        the same second reuse the cached strings.
+        
+        Returns:
+            tuple: ("YYYY-MM-DD HH:MM:SS", "YYYYMMDD_HHMMSS")
+        """
+        now_s = int(time.time())
+        cache = self._ts_cache
+        if cache[0] != now_s:
+            t = time.localtime(now_s)
+            day = self._day_cache
+            if day[0] != (t.tm_year, t.tm_yday):
+                day = self._day_cache = ((t.tm_year, t.tm_yday),) + _fmt_day(t)
+            cache = self._ts_cache = (
+                now_s,
+                f"{day[1]} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}",
+                f"{day[2]}_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}",
+            )
+        return cache[1], cache[2]
     
-    def calculate_delay(self, attempt):
+    def calculate_delay(self, attempt, base_delay=None):
         """
-        Calculate delay for current attempt using exponential backoff.
+        Calculate delay for current attempt using exponential backoff with jitter.
+        
+        The random jitter keeps many clients that failed together from
+        retrying in lockstep against a recovering service.
         
         Args:
             attempt: Current attempt number (0-indexed)
+            base_delay: Base delay in seconds (default: self.base_delay)
             
         Returns:
             float: Delay in seconds (capped at max_delay)
         """
-        delay = self.base_delay * (self.exponential_base ** attempt)
+        if base_delay is None:
+            base_delay = self.base_delay
+        delay = base_delay * (self.exponential_base ** attempt)
+        delay *= 1 + random.uniform(0, self.jitter)
         return min(delay, self.max_delay)
     
-    def log_error(self, component, error, context=None):
+    def log_error(self, component, error, context=None, level=logging.ERROR):
         """
         Log error to /Logs/error_[component]_[date].log.
         
+        Entries for components outside enabled_components, or below
+        min_level, are dropped before any formatting or I/O.
+        
         Args:
             component: Name of the component (watcher/skill name)
             error: Exception or error message
             context: Optional context dictionary
+            level: Severity as a logging level (default: logging.ERROR)
         """
-        date_str = datetime.now().strftime("%Y%m%d")
-        log_file = self.logs_dir / f"error_{component}_{date_str}.log"
+        if level < self.min_level or (self.enabled_components is not None
+                                      and component not in self.enabled_components):
+            return
         
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp, stamp = self._timestamps()
+        date_str = stamp[:8]
+        index = hash(component) & (_CACHE_SLOTS - 1)
+        slot = self._path_slots[index]
+        if slot is not None and slot[0] == component and slot[1] == date_str:
+            log_file = slot[2]
+        else:
+            log_file = os.path.join(self._logs_dir_str, f"error_{component}_{date_str}.log")
+            self._path_slots[index] = (component, date_str, log_file)
         
         # Format error message
         if isinstance(error, Exception):
@@ -93,14 +311,135 @@ Error Message: {error_msg}
         
         log_entry += "---\n\n"
         
-        # Append to log file
+        # Hand off to the writer thread; it appends to the file's buffer
+        self._write_q.put(('log', log_file, date_str, log_entry.encode('utf-8')))
+    
+    def _writer_loop(self):
+        """Drain the write queue (runs on the writer thread)."""
+        write_q = self._write_q
+        while True:
+            try:
+                kind, path, day, data = write_q.get(timeout=self._FLUSH_SECS)
+            except queue.Empty:
+                # Idle: don't leave entries sitting in memory
+                self._flush_buffers()
+                continue
+            
+            try:
+                if kind == 'log':
+                    if day != self._handles_day:
+                        # Day rolled over: yesterday's files won't be written again
+                        self._flush_buffers(close=True)
+                        self._handles_day = day
+                    
+                    buf = self._buffers.get(path)
+                    if buf is None:
+                        buf = self._buffers[path] = bytearray()
+                    buf.extend(data)
+                    
+                    if (len(buf) >= self._FLUSH_BYTES
+                            or time.monotonic() - self._last_flush >= self._FLUSH_SECS):
+                        self._flush_buffers()
+                elif kind == 'file':
+                    # data is (content, Future or None); the Future completes once
+                    # the file exists, or carries the exception if the write failed
+                    content, done = data
+                    try:
+                        try:
+                            f = open(path, 'wb')
+                        except FileNotFoundError:
+                            os.makedirs(os.path.dirname(path), exist_ok=True)
+                            f = open(path, 'wb')
+                        with f:
+                            f.write(content)
+                    except Exception as e:
+                        if done is None:
+                            raise
+                        print(f"Failed to write {path}: {e}")
+                        done.set_exception(e)
+                    else:
+                        if done is not None:
+                            done.set_result(path)
+                else:
+                    # 'flush' / 'close' request; data is the caller's Event
+                    try:
+                        self._flush_buffers(close=kind == 'close')
+                    finally:
+                        data.set()
+            except Exception as e:
+                print(f"Failed to write {path}: {e}")
+    
+    def _flush_buffers(self, close=False):
+        """Write every pending log buffer, optionally closing the fds (writer thread only)."""
+        for log_file, buf in self._buffers.items():
+            if not buf:
+                continue
+            try:
+                fd = self._fd_for(log_file)
+                with memoryview(buf) as view:
+                    while view:
+                        view = view[os.write(fd, view):]
+            except Exception as e:
+                print(f"Failed to write error log: {e}")
+        # Everything pending was written; drop the buffers of idle components too
+        self._buffers.clear()
+        self._last_flush = time.monotonic()
+        
+        if close:
+            for index, slot in enumerate(self._fd_slots):
+                if slot is not None:
+                    os.close(slot[1])
+                    self._fd_slots[index] = None
+    
+    def _fd_for(self, log_file):
+        """Get the append fd for a log file, evicting the slot's previous fd (writer thread only)."""
+        index = hash(log_file) & (_CACHE_SLOTS - 1)
+        slot = self._fd_slots[index]
+        if slot is not None:
+            if slot[0] == log_file:
+                return slot[1]
+            os.close(slot[1])
+            self._fd_slots[index] = None
+        
         try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-        except Exception as e:
-            print(f"Failed to write error log: {e}")
+            fd = os.open(log_file, _APPEND_FLAGS, 0o644)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            fd = os.open(log_file, _APPEND_FLAGS, 0o644)
+        self._fd_slots[index] = (log_file, fd)
+        return fd
     
-    def write_skill_error(self, skill_name, error, input_data=None, recovery_action=None):
+    def _request(self, kind):
+        """Ask the writer thread to flush or close, and wait until it has."""
+        done = threading.Event()
+        self._write_q.put((kind, None, None, done))
+        done.wait()
+    
+    def flush(self):
+        """Write all queued and buffered error output to disk."""
+        self._request('flush')
+    
+    def close(self):
+        """Flush queued error output and close the open log fds."""
+        self._request('close')
+    
+    def _write_file(self, path, content, wait):
+        """
+        Queue a whole-file write for the writer thread, optionally waiting for it.
+        
+        Returns:
+            str: path, or None if wait=True and the write failed
+        """
+        done = Future() if wait else None
+        self._write_q.put(('file', path, None, (content, done)))
+        if done is not None:
+            try:
+                done.result()
+            except Exception:
+                return None
+        return path
+    
+    def write_skill_error(self, skill_name, error, input_data=None, recovery_action=None, wait=False):
         """
         Write skill error to /Errors/skill_error_[date].md.
         
@@ -109,11 +448,16 @@ Error Message: {error_msg}
             error: Exception or error message
             input_data: Optional input data that caused the error
             recovery_action: Suggested recovery action
+            wait: Block until the report has been written (default: False)
+            
+        Returns:
+            str: Path to the report, or None if wait=True and it could not be
+                 written. Unless wait=True, the file is written in the background
+                 and the path is only eventually valid; call flush() (or pass
+                 wait=True) before opening it
         """
-        date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        error_file = self.errors_dir / f"skill_error_{skill_name}_{date_str}.md"
-        
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp, date_str = self._timestamps()
+        error_file = os.path.join(self._errors_dir_str, f"skill_error_{skill_name}_{date_str}.md")
         
         # Format error message
         if isinstance(error, Exception):
@@ -126,68 +470,21 @@ Error Message: {error_msg}
             traceback = None
         
         # Build error report
-        error_report = f"""---
-type: skill_error
-skill: {skill_name}
-timestamp: {timestamp}
-error_type: {error_type}
-status: needs_review
----
-
-# Skill Error Report
-
-**Skill:** {skill_name}  
-**Timestamp:** {timestamp}  
-**Error Type:** {error_type}
-
----
-
-## Error Details
-
-```
-{error_msg}
-```
-
-"""
-        
-        if input_data:
-            error_report += "## Input Data\n\n"
-            if isinstance(input_data, dict):
-                for key, value in input_data.items():
-                    error_report += f"- **{key}:** {value}\n"
-            elif isinstance(input_data, str):
-                error_report += f"{input_data[:500]}\n"  # Truncate long strings
-            error_report += "\n"
-        
-        if recovery_action:
-            error_report += f"""## Suggested Recovery Action
-
-{recovery_action}
-
-"""
+        error_report = _SKILL_ERROR_TEMPLATE.format_map({
+            'skill_name': skill_name,
+            'timestamp': timestamp,
+            'error_type': error_type,
+            'error_msg': error_msg,
+            'input_section': (f"## Input Data\n\n{_format_input(input_data, 500)}\n"
+                              if input_data else ""),
+            'recovery_section': (f"## Suggested Recovery Action\n\n{recovery_action}\n\n"
+                                 if recovery_action else ""),
+        })
         
-        error_report += f"""## Manual Review Required
-
-- [ ] Review error details above
-- [ ] Check input data for issues
-- [ ] Retry the operation manually
-- [ ] Update skill to handle this edge case
-- [ ] Move to /Done after resolution
-
----
-*Generated by Error Recovery System (Gold Tier)*
-"""
-        
-        # Write error report
-        try:
-            with open(error_file, 'w', encoding='utf-8') as f:
-                f.write(error_report)
-            return str(error_file)
-        except Exception as e:
-            print(f"Failed to write error report: {e}")
-            return None
+        # Written by the writer thread; the path is known up front
+        return self._write_file(error_file, error_report.encode('utf-8'), wait)
     
-    def write_manual_action(self, skill_name, action_type, description, original_input=None):
+    def write_manual_action(self, skill_name, action_type, description, original_input=None, wait=False):
         """
         Write manual action draft to /Plans/manual_action_[skill]_[date].md.
         
@@ -196,89 +493,62 @@ status: needs_review
             action_type: Type of action needed (email, post, call, etc.)
             description: Description of what needs to be done
             original_input: Original input that triggered the action
+            wait: Block until the draft has been written (default: False)
             
         Returns:
-            str: Path to the created file
+            str: Path to the draft, or None if wait=True and it could not be
+                 written. Unless wait=True, the file is written in the background
+                 and the path is only eventually valid; call flush() (or pass
+                 wait=True) before opening it
         """
-        date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        action_file = self.plans_dir / f"manual_action_{skill_name}_{date_str}.md"
-        
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp, date_str = self._timestamps()
+        action_file = os.path.join(self._plans_dir_str, f"manual_action_{skill_name}_{date_str}.md")
         
         # Build action draft
-        action_draft = f"""---
-type: manual_action
-skill: {skill_name}
-action_type: {action_type}
-created: {timestamp}
-status: pending
-priority: high
----
-
-# Manual Action Required
-
-**Skill:** {skill_name}  
-**Action Type:** {action_type}  
-**Created:** {timestamp}  
-**Status:** Pending Manual Execution
-
----
-
-## Description
-
-{description}
-
----
-
-## Original Input
-
-"""
+        action_draft = _MANUAL_ACTION_TEMPLATE.format_map({
+            'skill_name': skill_name,
+            'action_type': action_type,
+            'timestamp': timestamp,
+            'description': description,
+            'original_input': (_format_input(original_input, 1000) if original_input
+                               else "*No original input available*\n"),
+        })
         
-        if original_input:
-            if isinstance(original_input, dict):
-                for key, value in original_input.items():
-                    action_draft += f"- **{key}:** {value}\n"
-            elif isinstance(original_input, str):
-                action_draft += f"{original_input[:1000]}\n"
-        else:
-            action_draft += "*No original input available*\n"
+        # Written by the writer thread; the path is known up front
+        return self._write_file(action_file, action_draft.encode('utf-8'), wait)
+    
+    def _retry_log_allowed(self):
+        """
+        Check the retry-message rate limit, recording the message if allowed.
         
-        action_draft += f"""
----
-
-## Manual Execution Steps
-
-1. Review the description above
-2. Gather any necessary information
-3. Execute the {action_type} manually
-4. Document the outcome below
-5. Move this file to /Done after completion
-
----
-
-## Outcome (Fill after execution)
-
-**Executed At:** _______________  
-**Executed By:** _______________  
-**Result:** _______________
-
-**Notes:**
-
----
-*Generated by Error Recovery System (Gold Tier)*
-*Skill failed to execute automatically - manual intervention required*
-"""
+        Returns:
+            bool: True if fewer than _RETRY_LOG_BURST messages went out in the last second
+        """
+        if not _log.isEnabledFor(logging.WARNING):
+            return False
         
-        # Write action draft
-        try:
-            with open(action_file, 'w', encoding='utf-8') as f:
-                f.write(action_draft)
-            return str(action_file)
-        except Exception as e:
-            print(f"Failed to write manual action: {e}")
-            return None
+        times = self._retry_log_times
+        now = time.monotonic()
+        if len(times) == times.maxlen and now - times[0] < 1.0:
+            return False
+        times.append(now)
+        return True
+    
+    def _delay_schedule(self, max_retries, base_delay):
+        """
+        Precompute the un-jittered backoff delay before each retry.
+        
+        Args:
+            max_retries: Number of retries
+            base_delay: Base delay in seconds
+            
+        Returns:
+            tuple: Delay in seconds for retry 1..max_retries (capped at max_delay)
+        """
+        return tuple(min(base_delay * (self.exponential_base ** attempt), self.max_delay)
+                     for attempt in range(max_retries))
     
-    def retry_async(self, max_retries=None, base_delay=None, exceptions=None):
+    def retry_async(self, max_retries=None, base_delay=None, exceptions=None, unrecoverable=None):
         """
         Decorator for async functions with exponential backoff retry.
         
@@ -286,6 +556,8 @@ priority: high
             max_retries: Maximum retry attempts (default: self.max_retries)
             base_delay: Base delay in seconds (default: self.base_delay)
             exceptions: Tuple of exceptions to catch (default: Exception)
+            unrecoverable: Tuple of exceptions re-raised without retrying
+                           (default: self.unrecoverable)
             
         Returns:
             Decorated function
@@ -296,34 +568,42 @@ priority: high
             base_delay = self.base_delay
         if exceptions is None:
             exceptions = (Exception,)
+        if unrecoverable is None:
+            unrecoverable = self.unrecoverable
+        
+        # Backoff schedule and settings are fixed once per decorated function
+        delays = self._delay_schedule(max_retries, base_delay)
+        jitter, max_delay = self.jitter, self.max_delay
+        uniform, sleep = random.uniform, asyncio.sleep
+        allowed = self._retry_log_allowed
         
         def decorator(func):
             @wraps(func)
             async def wrapper(*args, **kwargs):
-                last_error = None
-                
-                for attempt in range(max_retries + 1):
+                for attempt, delay in enumerate(delays, 1):
                     try:
                         return await func(*args, **kwargs)
+                    except unrecoverable:
+                        raise
                     except exceptions as e:
-                        last_error = e
-                        
-                        if attempt < max_retries:
-                            delay = base_delay * (self.exponential_base ** attempt)
-                            delay = min(delay, self.max_delay)
-                            
-                            print(f"  Retry {attempt + 1}/{max_retries} after {delay:.1f}s: {e}")
-                            await asyncio.sleep(delay)
-                        else:
-                            print(f"  Max retries ({max_retries}) exceeded")
+                        delay = min(delay * (1 + uniform(0, jitter)), max_delay)
+                        if allowed():
+                            _log.warning("Retry %d/%d after %.1fs: %s", attempt, max_retries, delay, e)
+                        await sleep(delay)
                 
-                # All retries failed
-                raise last_error
+                # Final attempt: failures propagate
+                try:
+                    return await func(*args, **kwargs)
+                except unrecoverable:
+                    raise
+                except exceptions:
+                    _log.error("Max retries (%d) exceeded", max_retries)
+                    raise
             
             return wrapper
         return decorator
     
-    def retry_sync(self, max_retries=None, base_delay=None, exceptions=None):
+    def retry_sync(self, max_retries=None, base_delay=None, exceptions=None, unrecoverable=None):
         """
         Decorator for sync functions with exponential backoff retry.
         
@@ -331,6 +611,8 @@ priority: high
             max_retries: Maximum retry attempts (default: self.max_retries)
             base_delay: Base delay in seconds (default: self.base_delay)
             exceptions: Tuple of exceptions to catch (default: Exception)
+            unrecoverable: Tuple of exceptions re-raised without retrying
+                           (default: self.unrecoverable)
             
         Returns:
             Decorated function
@@ -341,29 +623,37 @@ priority: high
             base_delay = self.base_delay
         if exceptions is None:
             exceptions = (Exception,)
+        if unrecoverable is None:
+            unrecoverable = self.unrecoverable
+        
+        # Backoff schedule and settings are fixed once per decorated function
+        delays = self._delay_schedule(max_retries, base_delay)
+        jitter, max_delay = self.jitter, self.max_delay
+        uniform, sleep = random.uniform, time.sleep
+        allowed = self._retry_log_allowed
         
         def decorator(func):
             @wraps(func)
             def wrapper(*args, **kwargs):
-                last_error = None
-                
-                for attempt in range(max_retries + 1):
+                for attempt, delay in enumerate(delays, 1):
                     try:
                         return func(*args, **kwargs)
+                    except unrecoverable:
+                        raise
                     except exceptions as e:
-                        last_error = e
-                        
-                        if attempt < max_retries:
-                            delay = base_delay * (self.exponential_base ** attempt)
-                            delay = min(delay, self.max_delay)
-                            
-                            print(f"  Retry {attempt + 1}/{max_retries} after {delay:.1f}s: {e}")
-                            time.sleep(delay)
-                        else:
-                            print(f"  Max retries ({max_retries}) exceeded")
+                        delay = min(delay * (1 + uniform(0, jitter)), max_delay)
+                        if allowed():
+                            _log.warning("Retry %d/%d after %.1fs: %s", attempt, max_retries, delay, e)
+                        sleep(delay)
                 
-                # All retries failed
-                raise last_error
+                # Final attempt: failures propagate
+                try:
+                    return func(*args, **kwargs)
+                except unrecoverable:
+                    raise
+                except exceptions:
+                    _log.error("Max retries (%d) exceeded", max_retries)
+                    raise
             
             return wrapper
         return decorator
@@ -371,10 +661,14 @@ priority: high
 
 # Global instance for convenience
 _error_recovery = None
+_error_recovery_lock = threading.Lock()
 
 def get_error_recovery(base_dir=None):
     """Get or create global ErrorRecovery instance."""
     global _error_recovery
+    # Lock-free fast path; the lock only guards first construction
     if _error_recovery is None:
-        _error_recovery = ErrorRecovery(base_dir)
+        with _error_recovery_lock:
+            if _error_recovery is None:
+                _error_recovery = ErrorRecovery(base_dir)
     return _error_recovery
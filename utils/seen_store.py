@@ -0,0 +1,97 @@
+"""
+Seen-Item Store for Gold Tier Watchers
+Remembers which messages/notifications a watcher has already saved, across restarts.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+
+# Entries older than this are pruned; items still unread after that are saved again
+RETENTION_SECONDS = 30 * 24 * 3600
+
+# Pruning runs at most this often (checked on each prune_if_due call)
+PRUNE_INTERVAL = 24 * 3600
+
+
+def item_key(*parts):
+    """
+    Build a stable key for an item that has no ID of its own.
+    
+    Args:
+        *parts: Strings identifying the item (e.g. type, sender, preview)
+    
+    Returns:
+        str: 32-character hex digest
+    """
+    return hashlib.blake2b('\0'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class SeenStore:
+    """SQLite-backed set of item keys with the time each was first seen"""
+    
+    def __init__(self, db_path):
+        """
+        Open (or create) the store.
+        
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL with NORMAL sync: one small append per add, no fsync per commit
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY, seen_at REAL NOT NULL) WITHOUT ROWID'
+        )
+        self._conn.commit()
+        self._next_prune = 0.0
+    
+    def __contains__(self, key):
+        with self._lock:
+            row = self._conn.execute('SELECT 1 FROM seen WHERE key = ?', (key,)).fetchone()
+        return row is not None
+    
+    def add(self, key):
+        """
+        Record a key as seen (no-op if it already is).
+        
+        Args:
+            key: Item key
+        """
+        with self._lock:
+            self._conn.execute('INSERT OR IGNORE INTO seen (key, seen_at) VALUES (?, ?)', (key, time.time()))
+            self._conn.commit()
+    
+    def prune(self, max_age=RETENTION_SECONDS):
+        """
+        Forget keys first seen more than max_age seconds ago.
+        
+        Args:
+            max_age: Retention in seconds
+        
+        Returns:
+            int: Number of keys removed
+        """
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM seen WHERE seen_at < ?', (time.time() - max_age,))
+            self._conn.commit()
+        return cursor.rowcount
+    
+    def prune_if_due(self):
+        """Prune if PRUNE_INTERVAL has passed since the last prune (cheap to call every cycle)"""
+        now = time.time()
+        if now >= self._next_prune:
+            self._next_prune = now + PRUNE_INTERVAL
+            self.prune()
+    
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
@@ -7,26 +7,134 @@ Features: Exponential backoff retry, error logging, graceful degradation
 """
 
 import os
-import time
 import asyncio
+from collections import deque
 from datetime import datetime
 import re
 import sys
-import subprocess
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 # Add parent directory to path for utils import
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'utils'))
 from error_recovery import ErrorRecovery
+from browser_routes import block_heavy_assets
+
+# Optional aiofiles for the background markdown writer (falls back to a worker thread)
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+# One Playwright driver per process, shared by every watcher instance; each
+# watcher still launches its own persistent context for its session directory
+_PW_SINGLETON = None
+_PW_USERS = 0
+_PW_LOCK = asyncio.Lock()
+
+
+async def get_playwright():
+    """
+    Return the shared Playwright instance, starting it on first use.
+    
+    Every call must be paired with release_playwright().
+    
+    Returns:
+        The process-wide Playwright object
+    """
+    global _PW_SINGLETON, _PW_USERS
+    async with _PW_LOCK:
+        if _PW_SINGLETON is None:
+            _PW_SINGLETON = await async_playwright().start()
+        _PW_USERS += 1
+        return _PW_SINGLETON
+
+
+async def release_playwright():
+    """Drop one reference to the shared Playwright, stopping it after the last one"""
+    global _PW_SINGLETON, _PW_USERS
+    async with _PW_LOCK:
+        _PW_USERS = max(_PW_USERS - 1, 0)
+        if _PW_USERS == 0 and _PW_SINGLETON is not None:
+            pw, _PW_SINGLETON = _PW_SINGLETON, None
+            await pw.stop()
+
+
+# Runs in the page for eval_on_selector_all: for the first 10 matches, the
+# textContent of the first sender-selector match (null if none) and either the
+# textContent of the first text-selector match ('' if none) or, with no text
+# selector, the element's innerText
+_EXTRACT_JS = """(els, [senderSel, textSel]) => els.slice(0, 10).map(e => {
+    const sender = e.querySelector(senderSel);
+    let text;
+    if (textSel) {
+        const t = e.querySelector(textSel);
+        text = t ? t.textContent : '';
+    } else {
+        text = e.innerText;
+    }
+    return {sender: sender ? sender.textContent : null, text: text};
+})"""
+
+# Characters stripped from sender names when building filenames
+_NAME_CLEAN_RE = re.compile(r'[^\w\s-]')
+
+# Display names for the platform/type values the checks emit (avoids str.title() per save)
+_PLATFORM_META = {'facebook': 'Facebook', 'instagram': 'Instagram'}
+_TYPE_META = {'message': 'Message', 'post': 'Post'}
+
+# Priority and summary follow-up line for each keyword
+_PRIORITY_MAP = {'sales': 'high', 'client': 'medium', 'project': 'medium'}
+_ACTION_SUGGEST = {
+    'sales': " This appears to be a sales inquiry - consider prompt response.",
+    'client': " Client-related communication - may require attention.",
+    'project': " Project-related content - review for potential opportunities.",
+}
+
+# Needs_Action item: YAML frontmatter + markdown body, rendered with str.format_map.
+# Split around the original content so that text is encoded straight into the
+# file instead of being copied into one big string first
+_MD_HEAD_TEMPLATE = """---
+type: {platform}_{type}
+platform: {platform}
+from: "{sender}"
+subject: "{platform_title} {type_title} - {keyword} keyword found"
+received: "{received}"
+priority: {priority}
+status: pending
+keyword: {keyword}
+---
+
+# {platform_title} {type_title} Alert
+
+## Summary
+{summary}
+
+## Original Content
+"""
+
+_MD_TAIL_TEMPLATE = """
+
+## Detection Details
+- **Keyword Found:** {keyword}
+- **Platform:** {platform}
+- **Type:** {type}
+- **Detected At:** {detected}
+
+---
+*Generated by Facebook/Instagram Watcher*
+"""
 
 
 class FacebookInstagramWatcher:
-    def __init__(self, platform='facebook'):
+    def __init__(self, platform='facebook', error_recovery=None):
         """
         Initialize the watcher.
 
         Args:
             platform: 'facebook' or 'instagram' or 'both'
+            error_recovery: ErrorRecovery to share (default: a new one); with
+                platform='both' the per-site watchers share the parent's
         """
         self.platform = platform
         base_dir = os.path.dirname(os.path.dirname(__file__))
@@ -39,21 +147,50 @@ class FacebookInstagramWatcher:
 
         self.needs_action_dir = os.path.join(base_dir, 'Needs_Action')
         os.makedirs(self.needs_action_dir, exist_ok=True)
+        self._needs_action_prefix = self.needs_action_dir + os.sep
+        # Directory fd so each save resolves only the filename (POSIX; None elsewhere).
+        # Not needed for 'both': the per-site watchers do the saving
+        self._needs_action_fd = None
+        if platform != 'both' and os.open in os.supports_dir_fd:
+            self._needs_action_fd = os.open(
+                self.needs_action_dir, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+            )
 
-        # Initialize error recovery utility
-        self.error_recovery = ErrorRecovery(base_dir)
+        # Initialize error recovery utility (one writer thread however many sites)
+        self.error_recovery = error_recovery if error_recovery is not None else ErrorRecovery(base_dir)
         self.component_name = f"facebook_instagram_watcher_{platform}"
 
         self.playwright = None
         self.browser = None
         self.page = None
+        self.page_posts = None  # second tab so post checks run alongside message checks
+        self._site_watchers = []  # per-site watchers when platform='both'
+        self._page_targets = {}  # page -> URL it was last sent to by open_page()
+        # Set when the browser context or main page closes (the user closed the window)
+        self._closed_event = asyncio.Event()
+        
+        # Recently saved items, so sticky unread items aren't re-saved every cycle
+        self._seen = deque(maxlen=1024)
+        self._seen_set = set()
+        
+        # Rendered items waiting for the background writer
+        self.save_queue = asyncio.Queue()
+        self._writer_task = None
 
         # Keywords to detect
         self.keywords = ['sales', 'client', 'project']
+        # One case-insensitive alternation finds every keyword in a single pass
+        self._kw_re = re.compile('|'.join(map(re.escape, self.keywords)), re.IGNORECASE)
+        self._kw_rank = {keyword: rank for rank, keyword in enumerate(self.keywords)}
+        # Text shorter than this can't contain any keyword
+        self._min_kw_len = min(len(k) for k in self.keywords)
 
         # Check interval in seconds
         self.check_interval = 60
 
+        # Navigation timeout for check pages in ms (DOM ready, not every tracker request)
+        self.nav_timeout = 10000
+
         # Retry configuration
         self.max_retries = 3
         self.base_delay = 1  # seconds
@@ -61,17 +198,39 @@ class FacebookInstagramWatcher:
 
     async def cleanup(self):
         """Clean up resources"""
+        for watcher in self._site_watchers:
+            await watcher.cleanup()
+        self._site_watchers = []
+        
+        # Let the writer finish queued items before tearing down
+        if self._writer_task is not None:
+            if not self._writer_task.done():
+                try:
+                    await asyncio.wait_for(self.save_queue.join(), timeout=10)
+                except asyncio.TimeoutError:
+                    print("Cleanup: timed out writing queued items")
+                self._writer_task.cancel()
+            self._writer_task = None
+        
+        if self._needs_action_fd is not None:
+            os.close(self._needs_action_fd)
+            self._needs_action_fd = None
+        
         try:
             if self.browser:
                 await self.browser.close()
+                self.browser = None
             if self.playwright:
-                await self.playwright.stop()
+                self.playwright = None
+                await release_playwright()
         except Exception as e:
             print(f"Cleanup error: {e}")
 
     async def setup_browser(self, user_data_dir):
         """Setup browser with persistent context using system Chrome"""
-        self.playwright = await async_playwright().start()
+        # Never start a private driver here; all watchers share one via get_playwright()
+        if self.playwright is None:
+            self.playwright = await get_playwright()
 
         # Use system Chrome on Windows
         chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
@@ -86,7 +245,19 @@ class FacebookInstagramWatcher:
             viewport={'width': 1366, 'height': 768},
             executable_path=chrome_path
         )
+        # Images, fonts and video aren't needed to read text; don't download them
+        await block_heavy_assets(self.browser)
         self.page = await self.browser.new_page()
+        self.page_posts = await self.browser.new_page()
+        
+        # One writer task drains save_queue for the lifetime of the watcher
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._writer_loop())
+        
+        # Closing the window fires these; wait_or_exit() sleeps on the event instead of polling
+        self._closed_event.clear()
+        self.browser.on('close', lambda *_: self._closed_event.set())
+        self.page.on('close', lambda *_: self._closed_event.set())
         return self.page
 
     async def check_window_closed_manually(self):
@@ -114,30 +285,16 @@ class FacebookInstagramWatcher:
         print("Opening Facebook. Please log in if not already logged in.")
         print("Once logged in, the watcher will monitor for messages/posts.")
         
-        await self.page.goto('https://www.facebook.com/')
+        await self.page.goto('https://www.facebook.com/', wait_until='domcontentloaded')
         
-        # Wait for page to load and check if logged in
-        login_success = False
-        timeout = 180000  # 3 minutes timeout
-        start_time = time.time()
-
-        while not login_success and (time.time() - start_time) * 1000 < timeout:
-            try:
-                # Check if logged in by looking for the main feed or profile elements
-                feed_element = await self.page.query_selector('[role="main"], #ssrb_feed_start, div[aria-label="Stories"]')
-                if feed_element:
-                    print("Facebook logged in successfully!")
-                    login_success = True
-                    break
-                else:
-                    print("Waiting for Facebook login...")
-                    await self.page.wait_for_timeout(5000)
-            except Exception as e:
-                await self.page.wait_for_timeout(5000)
-
-        if not login_success:
+        # Wait (up to 3 minutes) for the main feed or profile elements to appear
+        print("Waiting for Facebook login...")
+        try:
+            await self.page.wait_for_selector('[role="main"], #ssrb_feed_start, div[aria-label="Stories"]', state='attached', timeout=180000)
+        except PlaywrightTimeoutError:
             print("Timeout waiting for Facebook login. Please ensure you are logged in.")
             raise Exception("Facebook login timeout")
+        print("Facebook logged in successfully!")
 
     async def login_instagram(self):
         """Navigate to Instagram and wait for login"""
@@ -146,70 +303,85 @@ class FacebookInstagramWatcher:
         print("="*50)
         print("Opening Instagram. Please log in if not already logged in.")
         
-        await self.page.goto('https://www.instagram.com/')
+        await self.page.goto('https://www.instagram.com/', wait_until='domcontentloaded')
         
-        # Wait for page to load and check if logged in
-        login_success = False
-        timeout = 180000  # 3 minutes timeout
-        start_time = time.time()
-
-        while not login_success and (time.time() - start_time) * 1000 < timeout:
-            try:
-                # Check if logged in by looking for the main feed or profile elements
-                feed_element = await self.page.query_selector('main, article, [role="main"]')
-                if feed_element:
-                    print("Instagram logged in successfully!")
-                    login_success = True
-                    break
-                else:
-                    print("Waiting for Instagram login...")
-                    await self.page.wait_for_timeout(5000)
-            except Exception as e:
-                await self.page.wait_for_timeout(5000)
-
-        if not login_success:
+        # Wait (up to 3 minutes) for the main feed or profile elements to appear
+        print("Waiting for Instagram login...")
+        try:
+            await self.page.wait_for_selector('main, article, [role="main"]', state='attached', timeout=180000)
+        except PlaywrightTimeoutError:
             print("Timeout waiting for Instagram login. Please ensure you are logged in.")
             raise Exception("Instagram login timeout")
+        print("Instagram logged in successfully!")
 
-    async def check_facebook_messages(self):
-        """Check Facebook Messenger for messages with keywords"""
+    def find_keyword(self, text):
+        """
+        Find the first keyword (in self.keywords order) present in the text.
+        
+        Args:
+            text: Text to scan (any case)
+            
+        Returns:
+            str: Matched keyword, or None
+        """
+        # Keep the highest-priority hit, as the list order did
+        best = None
+        for match in self._kw_re.finditer(text):
+            keyword = match.group(0).lower()
+            rank = self._kw_rank[keyword]
+            if rank == 0:
+                return keyword
+            if best is None or rank < best[0]:
+                best = (rank, keyword)
+        return best[1] if best else None
+
+    async def open_page(self, page, url):
+        """
+        Show url in page: reload if this page was already sent there, else navigate.
+        
+        Args:
+            page: Playwright page
+            url: Target URL
+        """
+        # Still under the target (redirects like /messages/t/<id> included)
+        if self._page_targets.get(page) == url and page.url.startswith(url):
+            await page.reload(wait_until='domcontentloaded', timeout=self.nav_timeout)
+        else:
+            await page.goto(url, wait_until='domcontentloaded', timeout=self.nav_timeout)
+            self._page_targets[page] = url
+
+    async def check_facebook_messages(self, page):
+        """Check Facebook Messenger for messages with keywords in the given page"""
         matching_items = []
         
         try:
             # Navigate to Messenger
-            await self.page.goto('https://www.facebook.com/messages/')
-            await self.page.wait_for_timeout(3000)
+            await self.open_page(page, 'https://www.facebook.com/messages/')
+            await page.wait_for_timeout(3000)
             
-            # Look for unread conversations
-            unread_elements = await self.page.query_selector_all(
-                '[aria-label*="unread"], [class*="unread"], div[role="row"][aria-selected="false"]'
+            # Sender and preview of up to 10 unread conversations, in one round-trip
+            conversations = await page.eval_on_selector_all(
+                '[aria-label*="unread"], [class*="unread"], div[role="row"][aria-selected="false"]',
+                _EXTRACT_JS,
+                ['span[dir="auto"], strong, h3', 'span:not([aria-label]), div[dir="auto"]']
             )
             
-            for elem in unread_elements[:10]:  # Check up to 10 unread
+            for item in conversations:
                 try:
-                    # Get sender name
-                    sender_elem = await elem.query_selector('span[dir="auto"], strong, h3')
-                    sender_name = await sender_elem.text_content() if sender_elem else "Unknown"
-                    
-                    # Get message preview
-                    message_elem = await elem.query_selector('span:not([aria-label]), div[dir="auto"]')
-                    message_text = await message_elem.text_content() if message_elem else ""
+                    message_text = item['text']
                     
                     # Check for keywords
-                    message_lower = message_text.lower()
-                    for keyword in self.keywords:
-                        if keyword in message_lower:
-                            matching_items.append({
-                                'platform': 'facebook',
-                                'type': 'message',
-                                'from': sender_name,
-                                'content': message_text,
-                                'keyword_found': keyword
-                            })
-                            break
-                    
-                    # Click to mark as read (optional)
-                    # await elem.click()
+                    if not message_text or len(message_text) < self._min_kw_len:
+                        continue
+                    keyword = self.find_keyword(message_text)
+                    if keyword:
+                        matching_items.append({
+                            'platform': 'facebook',
+                            'type': 'message',
+                            'from': item['sender'] if item['sender'] is not None else "Unknown",
+                            'content': message_text,
+                            'keyword_found': keyword
+                        })
                     
                 except Exception as e:
                     continue
@@ -219,41 +391,38 @@ class FacebookInstagramWatcher:
         
         return matching_items
 
-    async def check_facebook_posts(self):
-        """Check Facebook posts/notifications for keywords"""
+    async def check_facebook_posts(self, page):
+        """Check Facebook posts/notifications for keywords in the given page"""
         matching_items = []
         
         try:
             # Navigate to notifications
-            await self.page.goto('https://www.facebook.com/notifications/')
-            await self.page.wait_for_timeout(3000)
+            await self.open_page(page, 'https://www.facebook.com/notifications/')
+            await page.wait_for_timeout(3000)
             
-            # Look for notification elements
-            notification_elements = await self.page.query_selector_all(
-                '[role="article"], div[role="article"], [data-visualcompletion="css-img"]'
+            # Look for notification elements: text and author of up to 10, in one round-trip
+            elements = await page.eval_on_selector_all(
+                '[role="article"], div[role="article"], [data-visualcompletion="css-img"]',
+                _EXTRACT_JS,
+                ['strong, span[dir="auto"]', None]
             )
             
-            for elem in notification_elements[:10]:
+            for item in elements:
                 try:
-                    # Get notification text
-                    text_content = await elem.inner_text()
+                    text_content = item['text']
                     
                     # Check for keywords
-                    text_lower = text_content.lower()
-                    for keyword in self.keywords:
-                        if keyword in text_lower:
-                            # Try to extract who posted
-                            poster_elem = await elem.query_selector('strong, span[dir="auto"]')
-                            poster = await poster_elem.text_content() if poster_elem else "Unknown"
-                            
-                            matching_items.append({
-                                'platform': 'facebook',
-                                'type': 'post',
-                                'from': poster,
-                                'content': text_content[:500],  # Limit content length
-                                'keyword_found': keyword
-                            })
-                            break
+                    if not text_content or len(text_content) < self._min_kw_len:
+                        continue
+                    keyword = self.find_keyword(text_content)
+                    if keyword:
+                        matching_items.append({
+                            'platform': 'facebook',
+                            'type': 'post',
+                            'from': item['sender'] if item['sender'] is not None else "Unknown",
+                            'content': text_content[:500],  # Limit content length
+                            'keyword_found': keyword
+                        })
                             
                 except Exception as e:
                     continue
@@ -263,41 +432,38 @@ class FacebookInstagramWatcher:
         
         return matching_items
 
-    async def check_instagram_messages(self):
-        """Check Instagram Direct Messages for messages with keywords"""
+    async def check_instagram_messages(self, page):
+        """Check Instagram Direct Messages for messages with keywords in the given page"""
         matching_items = []
         
         try:
             # Navigate to Instagram DMs
-            await self.page.goto('https://www.instagram.com/direct/inbox/')
-            await self.page.wait_for_timeout(3000)
+            await self.open_page(page, 'https://www.instagram.com/direct/inbox/')
+            await page.wait_for_timeout(3000)
             
-            # Look for unread conversations
-            unread_elements = await self.page.query_selector_all(
-                'div[role="button"], article, div[tabindex]'
+            # Look for unread conversations: text and author of up to 10, in one round-trip
+            elements = await page.eval_on_selector_all(
+                'div[role="button"], article, div[tabindex]',
+                _EXTRACT_JS,
+                ['span, strong', None]
             )
             
-            for elem in unread_elements[:10]:
+            for item in elements:
                 try:
-                    # Get conversation text
-                    text_content = await elem.inner_text()
+                    text_content = item['text']
                     
                     # Check for keywords
-                    text_lower = text_content.lower()
-                    for keyword in self.keywords:
-                        if keyword in text_lower:
-                            # Try to extract username
-                            username_elem = await elem.query_selector('span, strong')
-                            username = await username_elem.text_content() if username_elem else "Unknown"
-                            
-                            matching_items.append({
-                                'platform': 'instagram',
-                                'type': 'message',
-                                'from': username,
-                                'content': text_content[:300],
-                                'keyword_found': keyword
-                            })
-                            break
+                    if not text_content or len(text_content) < self._min_kw_len:
+                        continue
+                    keyword = self.find_keyword(text_content)
+                    if keyword:
+                        matching_items.append({
+                            'platform': 'instagram',
+                            'type': 'message',
+                            'from': item['sender'] if item['sender'] is not None else "Unknown",
+                            'content': text_content[:300],
+                            'keyword_found': keyword
+                        })
                             
                 except Exception as e:
                     continue
@@ -307,41 +473,38 @@ class FacebookInstagramWatcher:
         
         return matching_items
 
-    async def check_instagram_posts(self):
-        """Check Instagram posts/notifications for keywords"""
+    async def check_instagram_posts(self, page):
+        """Check Instagram posts/notifications for keywords in the given page"""
         matching_items = []
         
         try:
             # Navigate to Instagram activity/notifications
-            await self.page.goto('https://www.instagram.com/accounts/activity/')
-            await self.page.wait_for_timeout(3000)
+            await self.open_page(page, 'https://www.instagram.com/accounts/activity/')
+            await page.wait_for_timeout(3000)
             
-            # Look for activity elements
-            activity_elements = await self.page.query_selector_all(
-                'article, div[role="button"], li'
+            # Look for activity elements: text and author of up to 10, in one round-trip
+            elements = await page.eval_on_selector_all(
+                'article, div[role="button"], li',
+                _EXTRACT_JS,
+                ['span, strong', None]
             )
             
-            for elem in activity_elements[:10]:
+            for item in elements:
                 try:
-                    # Get activity text
-                    text_content = await elem.inner_text()
+                    text_content = item['text']
                     
                     # Check for keywords
-                    text_lower = text_content.lower()
-                    for keyword in self.keywords:
-                        if keyword in text_lower:
-                            # Try to extract username
-                            username_elem = await elem.query_selector('span, strong')
-                            username = await username_elem.text_content() if username_elem else "Unknown"
-                            
-                            matching_items.append({
-                                'platform': 'instagram',
-                                'type': 'post',
-                                'from': username,
-                                'content': text_content[:300],
-                                'keyword_found': keyword
-                            })
-                            break
+                    if not text_content or len(text_content) < self._min_kw_len:
+                        continue
+                    keyword = self.find_keyword(text_content)
+                    if keyword:
+                        matching_items.append({
+                            'platform': 'instagram',
+                            'type': 'post',
+                            'from': item['sender'] if item['sender'] is not None else "Unknown",
+                            'content': text_content[:300],
+                            'keyword_found': keyword
+                        })
                             
                 except Exception as e:
                     continue
@@ -351,65 +514,131 @@ class FacebookInstagramWatcher:
         
         return matching_items
 
-    def save_to_markdown(self, item_data):
+    def is_new_item(self, item_data):
         """
-        Save item data to markdown file with YAML frontmatter in /Needs_Action
+        Record an item and report whether it was not seen recently.
+        
+        Args:
+            item_data: Dictionary with platform, from, content
+            
+        Returns:
+            bool: True the first time an item is seen (within the last 1024 items)
+        """
+        key = hash((item_data['platform'], item_data['from'], item_data['content'][:120]))
+        if key in self._seen_set:
+            return False
+        if len(self._seen) == self._seen.maxlen:
+            self._seen_set.discard(self._seen[0])
+        self._seen.append(key)
+        self._seen_set.add(key)
+        return True
+
+    def render_markdown(self, item_data):
+        """
+        Render item data as a markdown file with YAML frontmatter.
         
         Args:
             item_data: Dictionary with platform, type, from, content, keyword_found
+            
+        Returns:
+            tuple: (filepath in /Needs_Action, UTF-8 file parts as (head, content, tail))
         """
         # Determine priority based on keyword
-        priority_map = {'sales': 'high', 'client': 'medium', 'project': 'medium'}
-        priority = priority_map.get(item_data['keyword_found'], 'low')
+        priority = _PRIORITY_MAP.get(item_data['keyword_found'], 'low')
         
         # Generate summary
         summary = self.generate_summary(item_data)
         
-        # Create YAML frontmatter
-        yaml_frontmatter = f"""---
-type: {item_data['platform']}_{item_data['type']}
-platform: {item_data['platform']}
-from: "{item_data['from'].replace('"', "'")}"
-subject: "{item_data['platform'].title()} {item_data['type'].title()} - {item_data['keyword_found']} keyword found"
-received: "{datetime.now().isoformat()}"
-priority: {priority}
-status: pending
-keyword: {item_data['keyword_found']}
----
-"""
-        # Create markdown content
-        content = f"""{yaml_frontmatter}
-# {item_data['platform'].title()} {item_data['type'].title()} Alert
-
-## Summary
-{summary}
-
-## Original Content
-{item_data['content']}
-
-## Detection Details
-- **Keyword Found:** {item_data['keyword_found']}
-- **Platform:** {item_data['platform']}
-- **Type:** {item_data['type']}
-- **Detected At:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
----
-*Generated by Facebook/Instagram Watcher*
-"""
+        # One clock read for the received/detected times and the filename
+        now = datetime.now()
+        platform = item_data['platform']
+        item_type = item_data['type']
+        
+        # Render YAML frontmatter and markdown body around the original content
+        fields = {
+            'platform': platform,
+            'type': item_type,
+            'platform_title': _PLATFORM_META.get(platform) or platform.title(),
+            'type_title': _TYPE_META.get(item_type) or item_type.title(),
+            'sender': item_data['from'].translate({34: 39}),  # '"' -> "'" for the YAML string
+            'keyword': item_data['keyword_found'],
+            'received': now.isoformat(),
+            'detected': now.strftime('%Y-%m-%d %H:%M:%S'),
+            'priority': priority,
+            'summary': summary,
+        }
+        parts = (
+            _MD_HEAD_TEMPLATE.format_map(fields).encode('utf-8'),
+            item_data['content'].encode('utf-8'),
+            _MD_TAIL_TEMPLATE.format_map(fields).encode('utf-8'),
+        )
         
         # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        name_clean = re.sub(r'[^\w\s-]', '', item_data['from'])[:30]
-        filename = f"{item_data['platform']}_{item_data['type']}_{timestamp}_{name_clean}_{item_data['keyword_found']}.md"
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        name_clean = _NAME_CLEAN_RE.sub('', item_data['from'])[:30]
+        filename = f"{platform}_{item_type}_{timestamp}_{name_clean}_{item_data['keyword_found']}.md"
         
         # Save to Needs_Action directory
-        filepath = os.path.join(self.needs_action_dir, filename)
+        return self._needs_action_prefix + filename, parts
+    
+    def _open_item(self, filepath, flags):
+        """
+        os.open() a Needs_Action file, relative to the cached directory fd when there is one.
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        Args:
+            filepath: Path returned by render_markdown()
+            flags: os.open flags (also usable as an open() opener)
+            
+        Returns:
+            int: File descriptor
+        """
+        prefix = self._needs_action_prefix
+        if self._needs_action_fd is None or not filepath.startswith(prefix):
+            return os.open(filepath, flags, 0o644)
+        return os.open(filepath[len(prefix):], flags, 0o644, dir_fd=self._needs_action_fd)
+    
+    def _write_file(self, filepath, parts):
+        """Write the encoded parts to filepath in order (blocking)."""
+        fd = self._open_item(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            for part in parts:
+                os.write(fd, part)
+        finally:
+            os.close(fd)
+    
+    def save_to_markdown(self, item_data):
+        """
+        Save item data to markdown file with YAML frontmatter in /Needs_Action
         
-        print(f"  Saved: {filename}")
+        Args:
+            item_data: Dictionary with platform, type, from, content, keyword_found
+        """
+        filepath, parts = self.render_markdown(item_data)
+        self._write_file(filepath, parts)
+        print(f"  Saved: {os.path.basename(filepath)}")
         return filepath
+    
+    async def _writer_loop(self):
+        """Write queued (filepath, parts) items off the event loop's critical path"""
+        while True:
+            filepath, parts = await self.save_queue.get()
+            try:
+                if AIOFILES_AVAILABLE:
+                    async with aiofiles.open(filepath, 'wb', opener=self._open_item) as f:
+                        for part in parts:
+                            await f.write(part)
+                else:
+                    await asyncio.to_thread(self._write_file, filepath, parts)
+                print(f"  Saved: {os.path.basename(filepath)}")
+            except Exception as e:
+                print(f"  Error saving {os.path.basename(filepath)}: {e}")
+                self.error_recovery.log_error(
+                    self.component_name,
+                    e,
+                    {'operation': 'save_to_markdown', 'file': filepath}
+                )
+            finally:
+                self.save_queue.task_done()
 
     def generate_summary(self, item_data):
         """
@@ -421,7 +650,7 @@ keyword: {item_data['keyword_found']}
         Returns:
             str: Generated summary
         """
-        platform = item_data['platform'].title()
+        platform = _PLATFORM_META.get(item_data['platform']) or item_data['platform'].title()
         item_type = item_data['type']
         sender = item_data['from']
         keyword = item_data['keyword_found']
@@ -440,12 +669,7 @@ keyword: {item_data['keyword_found']}
             summary += f"Message: '{content}'"
         
         # Add action suggestion
-        if keyword == 'sales':
-            summary += " This appears to be a sales inquiry - consider prompt response."
-        elif keyword == 'client':
-            summary += " Client-related communication - may require attention."
-        elif keyword == 'project':
-            summary += " Project-related content - review for potential opportunities."
+        summary += _ACTION_SUGGEST.get(keyword, '')
         
         return summary
 
@@ -478,85 +702,27 @@ keyword: {item_data['keyword_found']}
             # Browser is closed or disconnected
             return True
 
-    async def check_browser_closed(self):
-        """Check if browser is closed and exit if so"""
-        if not self.browser:
-            return True
-
-        try:
-            # Method 1: Check if all pages are closed
-            pages = self.browser.pages
-            if not pages:
-                # No pages left - user closed the window
-                print("\n✓ Browser window closed by user.")
-                print("Stopping watcher gracefully...")
-                await self.cleanup()
-                # Exit with code 0 so PM2 won't restart
-                import sys
-                sys.exit(0)
-                return True
-
-            # Method 2: Check if our main page is closed
-            if self.page and self.page.is_closed():
-                print("\n✓ Browser window closed by user.")
-                print("Stopping watcher gracefully...")
-                await self.cleanup()
-                # Exit with code 0 so PM2 won't restart
-                import sys
-                sys.exit(0)
-                return True
-
-            # Method 3: Try to interact with page - will fail if window closed
-            try:
-                await self.page.evaluate('document.title')
-            except Exception as page_error:
-                # Page interaction failed - window likely closed
-                print("\n✓ Browser window closed by user.")
-                print("Stopping watcher gracefully...")
-                await self.cleanup()
-                import sys
-                sys.exit(0)
-                return True
-
-            # Method 4: Windows-specific - check for Chrome window using tasklist
-            if sys.platform == 'win32':
-                chrome_windows_closed = self._check_chrome_windows_windows()
-                if chrome_windows_closed:
-                    print("\n✓ Browser window closed by user.")
-                    print("Stopping watcher gracefully...")
-                    await self.cleanup()
-                    import sys
-                    sys.exit(0)
-                    return True
-
-            return False
-        except Exception as e:
-            # Browser is disconnected
-            print("\n✓ Browser window closed by user.")
-            print("Stopping watcher gracefully...")
-            await self.cleanup()
-            import sys
-            sys.exit(0)
-            return True
-
-    def _check_chrome_windows_windows(self):
-        """Check if Chrome windows are visible on Windows"""
+    async def wait_or_exit(self, timeout):
+        """
+        Wait up to timeout seconds, exiting cleanly if the browser window is closed.
+        
+        Args:
+            timeout: Seconds to wait before the next check
+        """
+        # Catch a close that happened while no one was waiting
+        if self.page is None or self.page.is_closed() or not self.browser.pages:
+            self._closed_event.set()
+        
         try:
-            # Use tasklist to check for chrome processes
-            result = subprocess.run(
-                'powershell -Command "(Get-Process chrome -ErrorAction SilentlyContinue | Where-Object {$_.MainWindowHandle -ne 0}).Count"',
-                shell=True, capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                try:
-                    count = int(result.stdout.strip())
-                    if count == 0:
-                        return True  # No Chrome windows found
-                except ValueError:
-                    pass
-            return False
-        except Exception:
-            return False  # If we can't check, assume window is still open
+            await asyncio.wait_for(self._closed_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return
+        
+        print("\n✓ Browser window closed by user.")
+        print("Stopping watcher gracefully...")
+        await self.cleanup()
+        # Exit with code 0 so PM2 won't restart
+        sys.exit(0)
 
     async def retry_with_backoff(self, func, *args, max_retries=None, base_delay=None, **kwargs):
         """
@@ -621,12 +787,17 @@ keyword: {item_data['keyword_found']}
                 try:
                     print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Checking Facebook...")
 
-                    # Check messages with retry
-                    messages = await self.retry_with_backoff(self.check_facebook_messages)
+                    # Check messages and posts concurrently (one tab each), with retry
+                    messages, posts = await asyncio.gather(
+                        self.retry_with_backoff(self.check_facebook_messages, self.page),
+                        self.retry_with_backoff(self.check_facebook_posts, self.page_posts),
+                    )
                     if messages:
                         for msg in messages:
                             try:
-                                self.save_to_markdown(msg)
+                                if not self.is_new_item(msg):
+                                    continue  # already saved
+                                self.save_queue.put_nowait(self.render_markdown(msg))
                             except Exception as e:
                                 print(f"  Error saving message: {e}")
                                 self.error_recovery.log_error(
@@ -639,12 +810,12 @@ keyword: {item_data['keyword_found']}
                     else:
                         print("  Skipped message check (network error)")
 
-                    # Check posts/notifications with retry
-                    posts = await self.retry_with_backoff(self.check_facebook_posts)
                     if posts:
                         for post in posts:
                             try:
-                                self.save_to_markdown(post)
+                                if not self.is_new_item(post):
+                                    continue  # already saved
+                                self.save_queue.put_nowait(self.render_markdown(post))
                             except Exception as e:
                                 print(f"  Error saving post: {e}")
                                 self.error_recovery.log_error(
@@ -660,10 +831,8 @@ keyword: {item_data['keyword_found']}
                     total_found = (len(messages) if messages else 0) + (len(posts) if posts else 0)
                     print(f"  Found {total_found} matching items")
 
-                    # Wait 60 seconds before next check, checking browser status every 2 seconds
-                    for _ in range(30):  # 30 x 2 seconds = 60 seconds
-                        await self.check_browser_closed()
-                        await self.page.wait_for_timeout(2000)
+                    # Wait until the next check, or stop as soon as the browser window closes
+                    await self.wait_or_exit(self.check_interval)
 
                 except Exception as e:
                     error_msg = f"Error during monitoring: {type(e).__name__}: {e}"
@@ -674,8 +843,7 @@ keyword: {item_data['keyword_found']}
                         {'stage': 'monitoring_loop'}
                     )
                     # Graceful: wait and continue loop
-                    await self.check_browser_closed()
-                    await self.page.wait_for_timeout(self.check_interval * 1000)
+                    await self.wait_or_exit(self.check_interval)
 
         except Exception as e:
             error_msg = f"Facebook Watcher error: {type(e).__name__}: {e}"
@@ -701,12 +869,17 @@ keyword: {item_data['keyword_found']}
                 try:
                     print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Checking Instagram...")
 
-                    # Check messages with retry
-                    messages = await self.retry_with_backoff(self.check_instagram_messages)
+                    # Check messages and posts concurrently (one tab each), with retry
+                    messages, posts = await asyncio.gather(
+                        self.retry_with_backoff(self.check_instagram_messages, self.page),
+                        self.retry_with_backoff(self.check_instagram_posts, self.page_posts),
+                    )
                     if messages:
                         for msg in messages:
                             try:
-                                self.save_to_markdown(msg)
+                                if not self.is_new_item(msg):
+                                    continue  # already saved
+                                self.save_queue.put_nowait(self.render_markdown(msg))
                             except Exception as e:
                                 print(f"  Error saving message: {e}")
                                 self.error_recovery.log_error(
@@ -718,12 +891,12 @@ keyword: {item_data['keyword_found']}
                     else:
                         print("  Skipped message check (network error)")
 
-                    # Check posts/notifications with retry
-                    posts = await self.retry_with_backoff(self.check_instagram_posts)
                     if posts:
                         for post in posts:
                             try:
-                                self.save_to_markdown(post)
+                                if not self.is_new_item(post):
+                                    continue  # already saved
+                                self.save_queue.put_nowait(self.render_markdown(post))
                             except Exception as e:
                                 print(f"  Error saving post: {e}")
                                 self.error_recovery.log_error(
@@ -738,10 +911,8 @@ keyword: {item_data['keyword_found']}
                     total_found = (len(messages) if messages else 0) + (len(posts) if posts else 0)
                     print(f"  Found {total_found} matching items")
 
-                    # Wait 60 seconds before next check, checking browser status every 2 seconds
-                    for _ in range(30):  # 30 x 2 seconds = 60 seconds
-                        await self.check_browser_closed()
-                        await self.page.wait_for_timeout(2000)
+                    # Wait until the next check, or stop as soon as the browser window closes
+                    await self.wait_or_exit(self.check_interval)
 
                 except Exception as e:
                     error_msg = f"Error during monitoring: {type(e).__name__}: {e}"
@@ -752,8 +923,7 @@ keyword: {item_data['keyword_found']}
                         {'stage': 'monitoring_loop'}
                     )
                     # Graceful: wait and continue loop
-                    await self.check_browser_closed()
-                    await self.page.wait_for_timeout(self.check_interval * 1000)
+                    await self.wait_or_exit(self.check_interval)
 
         except Exception as e:
             error_msg = f"Instagram Watcher error: {type(e).__name__}: {e}"
@@ -777,11 +947,13 @@ keyword: {item_data['keyword_found']}
             print(f"  Facebook: {self.session_path_facebook}")
             print(f"  Instagram: {self.session_path_instagram}")
             
-            # Run Facebook first, then Instagram (sequential for simplicity)
-            # For true parallel monitoring, you'd need separate browser instances
-            await self.run_facebook()
-            # After Facebook stops, run Instagram
-            await self.run_instagram()
+            # One watcher per site, checking concurrently. They share the Playwright
+            # driver (get_playwright) but each keeps its own persistent context,
+            # tabs and writer; closing either window stops the watcher
+            facebook = FacebookInstagramWatcher(platform='facebook', error_recovery=self.error_recovery)
+            instagram = FacebookInstagramWatcher(platform='instagram', error_recovery=self.error_recovery)
+            self._site_watchers = [facebook, instagram]
+            await asyncio.gather(facebook.run_facebook(), instagram.run_instagram())
         elif self.platform == 'facebook':
             await self.run_facebook()
         elif self.platform == 'instagram':
@@ -831,6 +1003,18 @@ if __name__ == "__main__":
     # Default to facebook, can be changed via command line argument
     platform = sys.argv[1] if len(sys.argv) > 1 else 'facebook'
 
+    # Faster event loop if installed (winloop on Windows, uvloop elsewhere);
+    # the default asyncio loop is used otherwise
+    try:
+        if sys.platform == 'win32':
+            import winloop
+            winloop.install()
+        else:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     try:
         exit_code = asyncio.run(main(platform))
         sys.exit(exit_code)
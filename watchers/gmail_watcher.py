@@ -8,19 +8,78 @@ Features: Exponential backoff retry, error logging, graceful degradation
 
 import os
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from base64 import urlsafe_b64decode as _b64d
 import json
-import pickle
 import sys
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
 import re
 
+# Project root (parent of watchers/); credentials, token and Needs_Action live here
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # Add parent directory to path for utils import
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'utils'))
+sys.path.insert(0, os.path.join(_PROJECT_ROOT, 'utils'))
 from error_recovery import ErrorRecovery
+from seen_store import SeenStore
+
+# Optional Gmail push notifications (users.watch -> Pub/Sub) to wake the loop early
+try:
+    from google.cloud import pubsub_v1
+    PUBSUB_AVAILABLE = True
+except ImportError:
+    PUBSUB_AVAILABLE = False
+
+# Needs_Action email file, filled with %-substitution of UTF-8 encoded fields
+_GMAIL_TMPL = b"""---
+type: gmail
+from: "%b"
+subject: "%b"
+received: "%b"
+priority: %b
+status: pending
+---
+
+## Email Content
+
+%b...
+
+"""
+
+# Characters stripped from subjects when building filenames
+_SUBJECT_CLEAN_RE = re.compile(r'[^\w\s-]')
+# Same deletion for ASCII subjects as a str.translate table (no regex engine)
+_SUBJECT_CLEAN_ASCII = {c: None for c in range(128) if _SUBJECT_CLEAN_RE.match(chr(c))}
+
+# Keywords that make an email high priority. Matched with a bytes pattern, so
+# IGNORECASE is ASCII-only, exactly like the lower()-then-`in` checks it replaces
+_PRIORITY_KEYWORDS = ('urgent', 'invoice', 'payment', 'sales')
+_PRIORITY_RE = re.compile(
+    '|'.join(map(re.escape, _PRIORITY_KEYWORDS)).encode('ascii'), re.IGNORECASE
+)
+
+# Unread important emails mentioning any priority keyword
+_SEARCH_QUERY = 'is:unread label:important (' + ' OR '.join(_PRIORITY_KEYWORDS) + ')'
+
+# Partial response for messages.get: only what parse_email reads (headers and the
+# body data of the message or its top-level parts), not snippet/labels/sizes
+_MESSAGE_FIELDS = 'payload(headers(name,value),body/data,parts(mimeType,body/data))'
+
+# Headers copied into the Needs_Action file
+_NEEDED_HEADERS = frozenset(('From', 'Subject', 'Date'))
+
+# Characters of the email body kept in the Needs_Action file
+BODY_PREVIEW_CHARS = 500
+
+# Gmail accepts at most 100 sub-requests per batch HTTP request
+BATCH_LIMIT = 100
+
+# Gmail stops pushing after 7 days unless users.watch is called again
+WATCH_RENEW_INTERVAL = 6 * 24 * 3600
 
 
 class GmailWatcher:
@@ -30,15 +89,53 @@ class GmailWatcher:
         self.service = None
         
         # Initialize error recovery utility
-        self.base_dir = os.path.dirname(os.path.dirname(__file__))
+        self.base_dir = _PROJECT_ROOT
         self.error_recovery = ErrorRecovery(self.base_dir)
         self.component_name = "gmail_watcher"
         
+        # File locations, resolved once
+        self.token_path = os.path.join(self.base_dir, 'token.json')
+        self.client_secrets_path = os.path.join(
+            self.base_dir,
+            'client_secret_854414858878-vdnp38fgnp123sunh5acg39evvkgoasb.apps.googleusercontent.com.json'
+        )
+        self.needs_action_dir = os.path.join(self.base_dir, 'Needs_Action')
+        os.makedirs(self.needs_action_dir, exist_ok=True)
+        self.state_path = os.path.join(self.base_dir, 'session', 'gmail', 'state.json')
+        
+        # Mailbox historyId as of the last complete check; history.list from it
+        # tells whether any important mail changed, so idle cycles skip the search
+        self.history_id = self._load_state().get('history_id')
+        # IDs of emails already saved, so a retry or restart never saves one twice
+        self.seen = SeenStore(os.path.join(self.base_dir, 'session', 'gmail', 'seen.db'))
+        # IDs of emails that were fetched but could not be parsed; retrying won't
+        # help, so for the rest of this run they are neither fetched again nor
+        # counted against a complete check (left unread for a person to look at)
+        self.unparsable_ids = set()
+        # Markdown files are rendered and written here, off the polling thread
+        self._io = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gmail-io')
+        
         # Retry configuration
         self.max_retries = 3
         self.base_delay = 1  # seconds
         self.max_delay = 60  # seconds
         
+        # Check interval in seconds; with push notifications on, mail wakes the loop
+        # and polling drops to a slow safety net in case a notification is lost
+        self.check_interval = 120
+        self.push_check_interval = 1800
+        self._poll_interval = self.check_interval
+        
+        # Set by a Pub/Sub push (new mail) or stop(); the loop waits on it instead of sleeping
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        
+        # Push notifications, enabled by GMAIL_PUBSUB_TOPIC + GMAIL_PUBSUB_SUBSCRIPTION
+        self.pubsub_topic = os.environ.get('GMAIL_PUBSUB_TOPIC')
+        self.pubsub_subscription = os.environ.get('GMAIL_PUBSUB_SUBSCRIPTION')
+        self._subscriber = None
+        self._watch_renewed_at = 0
+        
         self.setup_credentials()
 
     def retry_with_backoff(self, func, *args, max_retries=None, base_delay=None, **kwargs):
@@ -69,7 +166,9 @@ class GmailWatcher:
                 last_error = e
                 
                 if attempt < max_retries:
-                    delay = base_delay * (2 ** attempt)
+                    # Exponential backoff with random jitter, so watchers that failed
+                    # together don't retry the API in lockstep
+                    delay = self.error_recovery.calculate_delay(attempt, base_delay)
                     delay = min(delay, self.max_delay)
                     
                     print(f"  Retry {attempt + 1}/{max_retries} after {delay:.1f}s: {type(e).__name__}")
@@ -91,17 +190,15 @@ class GmailWatcher:
 
     def setup_credentials(self):
         """Setup Gmail API credentials"""
-        # Load credentials from credentials.json in root directory
-        credentials_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'credentials.json')
-        token_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'token.json')
+        # OAuth token and client secret live in the project root
+        token_path = self.token_path
 
         # Load existing token if available
         if os.path.exists(token_path):
             self.creds = Credentials.from_authorized_user_file(token_path, self.SCOPES)
         else:
             # Always use OAuth flow to get proper credentials
-            client_secrets_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                              'client_secret_854414858878-vdnp38fgnp123sunh5acg39evvkgoasb.apps.googleusercontent.com.json')
+            client_secrets_path = self.client_secrets_path
             
             if os.path.exists(client_secrets_path):
                 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -137,62 +234,117 @@ class GmailWatcher:
         if self.creds and self.creds.expired and self.creds.refresh_token:
             self.creds.refresh(Request())
             
-        # Build the service
+        # Build the service once; its authorized HTTP connection is reused by every
+        # list/batch/watch call for the life of the watcher
         if self.creds:
-            self.service = build('gmail', 'v1', credentials=self.creds)
+            self.service = build('gmail', 'v1', credentials=self.creds, cache_discovery=False)
     
     def search_emails(self, query):
-        """Search for emails based on query"""
+        """
+        Search for emails based on query, following every result page.
+        
+        Errors propagate (see retry_with_backoff), so a failed search is never
+        mistaken for an empty one.
+        
+        Args:
+            query: Gmail search query
+            
+        Returns:
+            list: Message stubs ({'id': ..., 'threadId': ...}), newest first
+        """
+        messages = []
+        request = self.service.users().messages().list(userId='me', q=query, maxResults=BATCH_LIMIT)
+        while request is not None:
+            results = request.execute()
+            messages.extend(results.get('messages', []))
+            request = self.service.users().messages().list_next(request, results)
+        return messages
+    
+    def check_history(self):
+        """
+        Check whether important mail was added or relabelled since history_id.
+        
+        Returns:
+            tuple: (changed, latest history ID). changed is True when there is no
+                usable history_id (first run, or older than Gmail keeps history)
+        """
+        if self.history_id is None:
+            return True, self.current_history_id()
+        
         try:
-            results = self.service.users().messages().list(
+            response = self.service.users().history().list(
                 userId='me',
-                q=query,
-                maxResults=10  # Limit to last 10 emails
+                startHistoryId=self.history_id,
+                labelId='IMPORTANT',
+                historyTypes=['messageAdded', 'labelAdded'],
+                maxResults=1,
+                fields='history/id,historyId'
             ).execute()
-
-            messages = results.get('messages', [])
-            return messages
         except Exception as e:
-            print(f"Error searching emails: {type(e).__name__}: {e}")
-            self.error_recovery.log_error(
-                self.component_name,
-                e,
-                {'operation': 'search_emails', 'query': query}
-            )
-            return []
+            # 404: startHistoryId has expired; do a full check from now on
+            if getattr(getattr(e, 'resp', None), 'status', None) == 404:
+                return True, self.current_history_id()
+            raise
+        return bool(response.get('history')), response['historyId']
+    
+    def current_history_id(self):
+        """Return the mailbox's current historyId"""
+        return self.service.users().getProfile(userId='me', fields='historyId').execute()['historyId']
+
+    def parse_email(self, msg_id, message):
+        """
+        Extract the fields saved to markdown from a messages.get response.
+        
+        Args:
+            msg_id: Gmail message ID
+            message: Full message resource
+            
+        Returns:
+            dict: id, from, subject, received, body (first BODY_PREVIEW_CHARS
+                characters) and body_bytes (full decoded text/plain payload)
+        """
+        # Extract only the headers that are saved (messages often carry 30+),
+        # stopping as soon as all of them have been seen
+        headers = {}
+        for header in message['payload']['headers']:
+            name = header['name']
+            if name in _NEEDED_HEADERS and name not in headers:
+                headers[name] = header['value']
+                if len(headers) == len(_NEEDED_HEADERS):
+                    break
+
+        # Get email body as bytes; only the saved preview is decoded to str
+        body_bytes = b""
+        if 'parts' in message['payload']:
+            for part in message['payload']['parts']:
+                if part['mimeType'] == 'text/plain':
+                    body_data = part['body']['data']
+                    body_bytes = _b64d(body_data)
+                    break
+        else:
+            body_data = message['payload']['body']['data']
+            body_bytes = _b64d(body_data)
+        # A UTF-8 character is at most 4 bytes, so this prefix holds the whole preview
+        body = body_bytes[:BODY_PREVIEW_CHARS * 4].decode('utf-8', errors='ignore')[:BODY_PREVIEW_CHARS]
+
+        return {
+            'id': msg_id,
+            'from': headers.get('From', ''),
+            'subject': headers.get('Subject', ''),
+            'received': headers.get('Date', ''),
+            'body': body,
+            'body_bytes': body_bytes
+        }
 
     def get_email_details(self, msg_id):
         """Get detailed information about an email"""
         try:
             message = self.service.users().messages().get(
                 userId='me',
-                id=msg_id
+                id=msg_id,
+                fields=_MESSAGE_FIELDS
             ).execute()
-
-            # Extract headers
-            headers = {header['name']: header['value'] for header in message['payload']['headers']}
-
-            # Get email body
-            body = ""
-            if 'parts' in message['payload']:
-                for part in message['payload']['parts']:
-                    if part['mimeType'] == 'text/plain':
-                        import base64
-                        body_data = part['body']['data']
-                        body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-                        break
-            else:
-                import base64
-                body_data = message['payload']['body']['data']
-                body = base64.urlsafe_b64decode(body_data).decode('utf-8')
-
-            return {
-                'id': msg_id,
-                'from': headers.get('From', ''),
-                'subject': headers.get('Subject', ''),
-                'received': headers.get('Date', ''),
-                'body': body
-            }
+            return self.parse_email(msg_id, message)
         except Exception as e:
             print(f"Error getting email details: {type(e).__name__}: {e}")
             self.error_recovery.log_error(
@@ -201,91 +353,306 @@ class GmailWatcher:
                 {'operation': 'get_email_details', 'msg_id': msg_id}
             )
             return None
+
+    def _execute_batch(self, requests, operation):
+        """
+        Send requests as Gmail batch HTTP requests (up to BATCH_LIMIT per POST).
+        
+        Args:
+            requests: List of (msg_id, HttpRequest) pairs
+            operation: Name used when logging per-message failures
+            
+        Returns:
+            dict: msg_id -> response, for the sub-requests that succeeded
+        """
+        responses = {}
+        
+        def on_response(request_id, response, exception):
+            if exception is None:
+                responses[request_id] = response
+                return
+            print(f"  Error in {operation} for {request_id}: {type(exception).__name__}: {exception}")
+            self.error_recovery.log_error(
+                self.component_name,
+                exception,
+                {'operation': operation, 'msg_id': request_id}
+            )
+        
+        for start in range(0, len(requests), BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for msg_id, request in requests[start:start + BATCH_LIMIT]:
+                batch.add(request, request_id=msg_id)
+            batch.execute()
+        return responses
+
+    def get_emails_details(self, messages):
+        """
+        Fetch and parse several emails with one batch request instead of one call each.
+        
+        Args:
+            messages: Message stubs ({'id': ...}) from search_emails
+            
+        Returns:
+            list: Email data dicts (see parse_email) for messages that were fetched
+        """
+        users = self.service.users()
+        responses = self._execute_batch(
+            [(msg['id'], users.messages().get(userId='me', id=msg['id'], fields=_MESSAGE_FIELDS))
+             for msg in messages],
+            'get_email_details'
+        )
+        
+        emails = []
+        for msg in messages:
+            message = responses.get(msg['id'])
+            if message is None:
+                continue
+            try:
+                emails.append(self.parse_email(msg['id'], message))
+            except Exception as e:
+                self.unparsable_ids.add(msg['id'])
+                print(f"Error getting email details: {type(e).__name__}: {e}")
+                self.error_recovery.log_error(
+                    self.component_name,
+                    e,
+                    {'operation': 'get_email_details', 'msg_id': msg['id']}
+                )
+        return emails
+
+    def mark_as_read(self, msg_ids):
+        """Remove the UNREAD label from the given messages in one batch request"""
+        users = self.service.users()
+        self._execute_batch(
+            [(msg_id, users.messages().modify(
+                userId='me',
+                id=msg_id,
+                body={'removeLabelIds': ['UNREAD']}
+            )) for msg_id in msg_ids],
+            'mark_as_read'
+        )
     
     def save_email_to_markdown(self, email_data):
         """Save email data to markdown file with YAML frontmatter"""
         # Determine priority based on keywords
-        keywords = ['urgent', 'invoice', 'payment', 'sales']
-        body_lower = email_data['body'].lower()
-        subject_lower = email_data['subject'].lower()
-        
-        priority = 'low'
-        for keyword in keywords:
-            if keyword in body_lower or keyword in subject_lower:
-                priority = 'high'
-                break
-        
-        # Create YAML frontmatter
-        yaml_frontmatter = f"""---
-type: gmail
-from: "{email_data['from']}"
-subject: "{email_data['subject']}"
-received: "{email_data['received']}"
-priority: {priority}
-status: pending
----
-"""
+        # One case-insensitive pass over the subject, then the raw body bytes
+        # (no lowercased copies; the full body is never decoded)
+        if (_PRIORITY_RE.search(email_data['subject'].encode('utf-8'))
+                or _PRIORITY_RE.search(email_data['body_bytes'])):
+            priority = 'high'
+        else:
+            priority = 'low'
         
-        # Create markdown content
-        content = f"{yaml_frontmatter}\n## Email Content\n\n{email_data['body'][:500]}...\n\n"
+        # Render YAML frontmatter and markdown content straight to bytes
+        content = _GMAIL_TMPL % (
+            email_data['from'].encode('utf-8'),
+            email_data['subject'].encode('utf-8'),
+            email_data['received'].encode('utf-8'),
+            priority.encode('ascii'),
+            email_data['body'].encode('utf-8'),
+        )
         
-        # Generate filename based on timestamp and subject
+        # Generate filename based on timestamp, subject and message ID; emails
+        # saved together share a timestamp, and subjects repeat ("Payment received")
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        subject_clean = re.sub(r'[^\w\s-]', '', email_data['subject'])[:50]
-        filename = f"gmail_{timestamp}_{subject_clean}.md"
+        subject = email_data['subject']
+        if subject.isascii():
+            subject_clean = subject.translate(_SUBJECT_CLEAN_ASCII)[:50]
+        else:
+            subject_clean = _SUBJECT_CLEAN_RE.sub('', subject)[:50]
+        filename = f"gmail_{timestamp}_{subject_clean}_{email_data['id']}.md"
         
         # Save to Needs_Action directory
-        needs_action_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'Needs_Action')
-        filepath = os.path.join(needs_action_dir, filename)
+        filepath = os.path.join(self.needs_action_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
         
         print(f"Saved email to {filepath}")
     
+    def _load_state(self):
+        """Read persisted watcher state (empty if missing or unreadable)"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_state(self):
+        """Persist watcher state (atomically replaces the state file)"""
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'history_id': self.history_id}, f)
+        os.replace(tmp_path, self.state_path)
+    
+    def process_messages(self, messages):
+        """
+        Save search results to Needs_Action and mark them as read.
+        
+        Emails saved on an earlier cycle (self.seen) are not fetched again,
+        only marked as read again; emails in self.unparsable_ids are skipped.
+        
+        Args:
+            messages: Message stubs ({'id': ...}) from search_emails
+            
+        Returns:
+            bool: True if every new email was fetched and either saved or
+                found unparsable
+        """
+        processed_ids = []
+        new_messages = []
+        for msg in messages:
+            # Saved before (e.g. marking it read failed); just mark it again
+            if msg['id'] in self.seen:
+                processed_ids.append(msg['id'])
+            elif msg['id'] not in self.unparsable_ids:
+                new_messages.append(msg)
+        
+        # One batch request for all new message bodies
+        emails = []
+        if new_messages:
+            emails = self.retry_with_backoff(self.get_emails_details, new_messages) or []
+        pending = [(email_data, self._io.submit(self.save_email_to_markdown, email_data))
+                   for email_data in emails]
+        
+        # Every write must land before its email is marked as read
+        saved = 0
+        for email_data, future in pending:
+            try:
+                future.result()
+                self.seen.add(email_data['id'])
+                processed_ids.append(email_data['id'])
+                saved += 1
+            except Exception as e:
+                print(f"  Error processing email {email_data['id']}: {e}")
+                self.error_recovery.log_error(
+                    self.component_name,
+                    e,
+                    {'operation': 'process_email', 'msg_id': email_data['id']}
+                )
+                # Graceful: skip this email, continue with others
+                continue
+        
+        # Mark as read after processing, again as one batch request
+        if processed_ids:
+            try:
+                self.mark_as_read(processed_ids)
+            except Exception as e:
+                print(f"  Error marking emails as read: {e}")
+                self.error_recovery.log_error(
+                    self.component_name,
+                    e,
+                    {'operation': 'mark_as_read', 'msg_ids': processed_ids}
+                )
+        
+        # Unparsable emails count as handled; fetch and save failures do not
+        return saved == sum(msg['id'] not in self.unparsable_ids for msg in new_messages)
+    
+    def start_push_notifications(self):
+        """
+        Ask Gmail to push new-mail notifications to Pub/Sub and subscribe to them.
+        
+        Each notification wakes the run loop immediately; polling continues
+        every push_check_interval as a fallback.
+        
+        Returns:
+            bool: True if push notifications are active
+        """
+        if not (PUBSUB_AVAILABLE and self.pubsub_topic and self.pubsub_subscription):
+            return False
+        
+        try:
+            self.renew_watch()
+            self._subscriber = pubsub_v1.SubscriberClient()
+            
+            def on_notification(message):
+                message.ack()
+                self._wake_event.set()
+            
+            self._subscriber.subscribe(self.pubsub_subscription, callback=on_notification)
+            print(f"Push notifications: {self.pubsub_subscription}")
+            return True
+        except Exception as e:
+            print(f"Push notifications unavailable, polling only: {type(e).__name__}: {e}")
+            self.error_recovery.log_error(
+                self.component_name,
+                e,
+                {'operation': 'start_push_notifications'}
+            )
+            self._subscriber = None
+            return False
+    
+    def renew_watch(self):
+        """(Re)register the users.watch push subscription for the IMPORTANT label"""
+        self.service.users().watch(
+            userId='me',
+            body={
+                'topicName': self.pubsub_topic,
+                'labelIds': ['IMPORTANT'],
+                'labelFilterAction': 'include'
+            }
+        ).execute()
+        self._watch_renewed_at = time.time()
+    
+    def wait_for_next_check(self):
+        """
+        Block until new mail is pushed, stop() is called, or the poll interval passes.
+        
+        Returns:
+            bool: True if the watcher should stop
+        """
+        self._wake_event.wait(self._poll_interval)
+        self._wake_event.clear()
+        return self._stop_event.is_set()
+    
+    def stop(self):
+        """Stop the run loop at its next wait"""
+        self._stop_event.set()
+        self._wake_event.set()
+    
     def run(self):
         """Main loop to monitor Gmail"""
         print("Starting Gmail Watcher...")
         print(f"Error recovery: Max retries={self.max_retries}, Backoff=1-60s")
+        push_enabled = self.start_push_notifications()
+        self._poll_interval = self.push_check_interval if push_enabled else self.check_interval
 
         try:
-            while True:
+            while not self._stop_event.is_set():
                 try:
-                    # Search for unread important emails with keywords
-                    query = 'is:unread label:important (urgent OR invoice OR payment OR sales)'
-                    
-                    # Use retry with backoff
-                    messages = self.retry_with_backoff(self.search_emails, query)
+                    # Search only when important mail arrived or was relabelled since
+                    # the last complete check; if the history check fails, search anyway
+                    changed, latest_history_id = self.retry_with_backoff(self.check_history) or (True, None)
                     
-                    if messages:
-                        for msg in messages:
-                            try:
-                                email_data = self.retry_with_backoff(self.get_email_details, msg['id'])
-                                if email_data:
-                                    self.save_email_to_markdown(email_data)
-
-                                    # Mark as read after processing
-                                    self.service.users().messages().modify(
-                                        userId='me',
-                                        id=msg['id'],
-                                        body={'removeLabelIds': ['UNREAD']}
-                                    ).execute()
-                            except Exception as e:
-                                print(f"  Error processing email {msg['id']}: {e}")
-                                self.error_recovery.log_error(
-                                    self.component_name,
-                                    e,
-                                    {'operation': 'process_email', 'msg_id': msg.get('id', 'unknown')}
-                                )
-                                # Graceful: skip this email, continue with others
-                                continue
+                    if not changed:
+                        complete = True
+                        print("Checked Gmail, no new important mail")
                     else:
-                        print("  Skipped email check (API error)")
+                        # Search for unread important emails with keywords (all pages)
+                        messages = self.retry_with_backoff(self.search_emails, _SEARCH_QUERY)
+                        
+                        complete = messages is not None and self.process_messages(messages)
+                        if messages is None:
+                            print("  Skipped email check (API error)")
+                        
+                        print(f"Checked Gmail, found {len(messages) if messages else 0} matching emails")
+                    
+                    # Move the history marker only once everything up to it was handled;
+                    # otherwise the next cycle searches again (self.seen skips repeats)
+                    if complete and latest_history_id and latest_history_id != self.history_id:
+                        self.history_id = latest_history_id
+                        self._save_state()
+                    self.seen.prune_if_due()
 
-                    print(f"Checked Gmail, found {len(messages) if messages else 0} matching emails")
+                    if push_enabled and time.time() - self._watch_renewed_at > WATCH_RENEW_INTERVAL:
+                        self.retry_with_backoff(self.renew_watch)
 
-                    # Wait 120 seconds before next check
-                    time.sleep(120)
+                    # Wait for new mail (push) or the next scheduled check
+                    if self.wait_for_next_check():
+                        break
 
                 except Exception as e:
                     error_msg = f"Error in Gmail Watcher: {type(e).__name__}: {e}"
@@ -296,7 +663,8 @@ status: pending
                         {'stage': 'monitoring_loop'}
                     )
                     # Graceful: wait before retrying
-                    time.sleep(120)
+                    if self.wait_for_next_check():
+                        break
                     
         except KeyboardInterrupt:
             print("Gmail Watcher stopped by user")
@@ -309,6 +677,12 @@ status: pending
                 {'stage': 'fatal'}
             )
             raise
+        finally:
+            if self._subscriber is not None:
+                self._subscriber.close()
+                self._subscriber = None
+            self._io.shutdown(wait=True)
+            self.seen.close()
 
 
 if __name__ == "__main__":
@@ -321,9 +695,14 @@ if __name__ == "__main__":
         def write(self, msg): pass
         def flush(self): pass
     
+    watcher = None
+    
     def signal_handler(sig, frame):
         print("\nGmail Watcher stopped by user")
         sys.stdout.flush()
+        # os._exit skips atexit, so write out buffered error logs first
+        if watcher is not None:
+            watcher.error_recovery.flush()
         os._exit(0)  # Force immediate exit, no cleanup
     
     signal.signal(signal.SIGINT, signal_handler)
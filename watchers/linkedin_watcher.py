@@ -12,11 +12,58 @@ import asyncio
 from datetime import datetime
 import re
 import sys
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+# Optional aiofiles for markdown writes (falls back to a worker thread)
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
 
 # Add parent directory to path for utils import
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'utils'))
 from error_recovery import ErrorRecovery
+from seen_store import SeenStore, item_key
+from browser_routes import block_heavy_assets
+
+MESSAGES_URL = 'https://www.linkedin.com/messaging/'
+NOTIFICATIONS_URL = 'https://www.linkedin.com/notifications/'
+
+# Needs_Action item file, filled with %-substitution of UTF-8 encoded fields
+_LINKEDIN_TMPL = b"""---
+type: linkedin_%(type)b
+from: "%(sender)b"
+subject: "LinkedIn %(type)b - %(keyword)b keyword found"
+received: "%(received)b"
+priority: %(priority)b
+status: pending
+---
+
+## LinkedIn %(title)b Details
+
+Preview: %(preview)b
+Keyword found: %(keyword)b
+
+"""
+
+_PRIORITY_MAP = {'sales': b'high', 'client': b'medium', 'project': b'medium'}
+
+# Characters stripped from sender names when building filenames
+_SENDER_CLEAN_RE = re.compile(r'[^\w\s-]')
+
+# Item selectors, also used to tell when a reloaded list has rendered
+_UNREAD_MESSAGE_SELECTOR = '[data-test-is-unread]'
+_NOTIFICATION_SELECTOR = '[data-test-notification]'
+
+# Runs in the page for eval_on_selector_all: for every match, the textContent of
+# the first sender-selector match (null if none or no selector) and of the first
+# text-selector match ('' if none), so a whole list is read in one round-trip
+_EXTRACT_JS = """(els, [senderSel, textSel]) => els.map(e => {
+    const sender = senderSel ? e.querySelector(senderSel) : null;
+    const text = e.querySelector(textSel);
+    return [sender ? sender.textContent : null, text ? text.textContent : ''];
+})"""
 
 
 class LinkedInWatcher:
@@ -26,6 +73,8 @@ class LinkedInWatcher:
         
         # Initialize error recovery utility
         self.base_dir = os.path.dirname(os.path.dirname(__file__))
+        self.needs_action_dir = os.path.join(self.base_dir, 'Needs_Action')
+        os.makedirs(self.needs_action_dir, exist_ok=True)
         self.error_recovery = ErrorRecovery(self.base_dir)
         self.component_name = "linkedin_watcher"
         
@@ -34,9 +83,26 @@ class LinkedInWatcher:
         self.base_delay = 1  # seconds
         self.max_delay = 60  # seconds
         
+        # Items already saved; the lists have no stable IDs, so items are keyed
+        # by type, sender and preview (see seen_store.item_key). Kept outside the
+        # browser profile directory.
+        self.seen = SeenStore(os.path.join(self.base_dir, 'session', 'linkedin_seen.db'))
+        
         self.playwright = None
         self.browser = None
-        self.page = None
+        self.page = None  # Messages tab (also used for login)
+        self.page_notifications = None
+        
+        # Navigation: each tab stays on its list and is reloaded per check
+        self.nav_timeout = 10000  # ms
+        self.render_timeout = 3000  # ms to wait for list items after a load
+        self._page_targets = {}
+        
+        # Keywords to look for, highest priority first
+        self.keywords = ['sales', 'client', 'project']
+        # One case-insensitive alternation finds every keyword in a single pass
+        self._kw_re = re.compile('|'.join(map(re.escape, self.keywords)), re.IGNORECASE)
+        self._kw_rank = {keyword: rank for rank, keyword in enumerate(self.keywords)}
     
     async def cleanup(self):
         """Clean up resources"""
@@ -47,6 +113,7 @@ class LinkedInWatcher:
                 await self.playwright.stop()
         except:
             pass
+        self.seen.close()
         
     async def setup_browser(self):
         """Setup browser with persistent context"""
@@ -56,7 +123,10 @@ class LinkedInWatcher:
             headless=False,  # Set to True if you want to run in background
             viewport={'width': 1280, 'height': 800}
         )
+        # Images, fonts and video aren't needed to read the lists; don't download them
+        await block_heavy_assets(self.browser)
         self.page = await self.browser.new_page()
+        self.page_notifications = await self.browser.new_page()
         
     async def login_linkedin(self):
         """Navigate to LinkedIn and wait for login"""
@@ -90,119 +160,161 @@ class LinkedInWatcher:
             print("Timeout waiting for LinkedIn login. Please ensure you logged in and navigated to your homepage.")
             raise Exception("LinkedIn login timeout")
         
-    async def check_messages_and_notifications(self):
-        """Check for new messages and notifications with business keywords"""
-        # Keywords to look for
-        keywords = ['sales', 'client', 'project']
+    def find_keyword(self, text):
+        """
+        Find the first keyword (in self.keywords order) present in the text.
+        
+        Args:
+            text: Text to scan (any case)
+            
+        Returns:
+            str: Matched keyword, or None
+        """
+        # Keep the highest-priority hit, as the list order did
+        best = None
+        for match in self._kw_re.finditer(text):
+            keyword = match.group(0).lower()
+            rank = self._kw_rank[keyword]
+            if rank == 0:
+                return keyword
+            if best is None or rank < best[0]:
+                best = (rank, keyword)
+        return best[1] if best else None
+    
+    async def open_page(self, page, url):
+        """
+        Show url in page: reload if this page was already sent there, else navigate.
+        
+        Args:
+            page: Playwright page
+            url: Target URL
+        """
+        if self._page_targets.get(page) == url and page.url.startswith(url):
+            await page.reload(wait_until='domcontentloaded', timeout=self.nav_timeout)
+        else:
+            await page.goto(url, wait_until='domcontentloaded', timeout=self.nav_timeout)
+            self._page_targets[page] = url
+    
+    async def wait_for_items(self, page, selector):
+        """
+        Wait until the list has rendered its first item, up to render_timeout.
         
+        Args:
+            page: Playwright page
+            selector: Item selector
+        """
+        try:
+            await page.wait_for_selector(selector, state='attached', timeout=self.render_timeout)
+        except PlaywrightTimeoutError:
+            # Nothing matching (e.g. no unread messages); read whatever is there
+            pass
+    
+    async def check_messages(self, page):
+        """Check unread messages with business keywords in the given page"""
         matching_items = []
         
-        # Check messages
         try:
             # Navigate to messages
-            await self.page.goto('https://www.linkedin.com/messaging/')
-            await self.page.wait_for_timeout(3000)  # Wait for page to load
+            await self.open_page(page, MESSAGES_URL)
+            await self.wait_for_items(page, _UNREAD_MESSAGE_SELECTOR)
             
-            # Look for unread messages
-            # Using a more general selector for unread messages
-            unread_messages = await self.page.query_selector_all('[data-test-is-unread]')
+            # Sender and preview of every unread message, in one round-trip
+            unread_messages = await page.eval_on_selector_all(
+                _UNREAD_MESSAGE_SELECTOR,
+                _EXTRACT_JS,
+                ['img[alt], span[aria-hidden="true"]', 'p, span, div']
+            )
             
-            for message in unread_messages:
-                try:
-                    # Get sender name
-                    sender_element = await message.query_selector('img[alt], span[aria-hidden="true"]')
-                    sender = await sender_element.text_content() if sender_element else "Unknown"
-                    
-                    # Get message preview
-                    preview_element = await message.query_selector('p, span, div')
-                    preview = await preview_element.text_content() if preview_element else ""
-                    
-                    # Check if message contains keywords
-                    preview_lower = preview.lower()
-                    for keyword in keywords:
-                        if keyword in preview_lower:
-                            matching_items.append({
-                                'type': 'message',
-                                'sender': sender.strip(),
-                                'preview': preview.strip(),
-                                'keyword_found': keyword
-                            })
-                            break  # Found a keyword, no need to check others
-                            
-                except Exception as e:
-                    print(f"Error processing message: {e}")
-                    continue
+            for sender, preview in unread_messages:
+                # Check if message contains keywords
+                keyword = self.find_keyword(preview)
+                if keyword:
+                    matching_items.append({
+                        'type': 'message',
+                        'sender': sender.strip() if sender is not None else "Unknown",
+                        'preview': preview.strip(),
+                        'keyword_found': keyword
+                    })
         except Exception as e:
             print(f"Error checking messages: {e}")
         
-        # Check notifications
+        return matching_items
+    
+    async def check_notifications(self, page):
+        """Check notifications with business keywords in the given page"""
+        matching_items = []
+        
         try:
             # Navigate to notifications
-            await self.page.goto('https://www.linkedin.com/notifications/')
-            await self.page.wait_for_timeout(3000)  # Wait for page to load
+            await self.open_page(page, NOTIFICATIONS_URL)
+            await self.wait_for_items(page, _NOTIFICATION_SELECTOR)
             
-            # Look for unread notifications
-            notification_elements = await self.page.query_selector_all('[data-test-notification]')
+            # Text of every notification, in one round-trip
+            notifications = await page.eval_on_selector_all(
+                _NOTIFICATION_SELECTOR, _EXTRACT_JS, [None, 'span, p, div']
+            )
             
-            for notification in notification_elements:
-                try:
-                    # Get notification text
-                    text_element = await notification.query_selector('span, p, div')
-                    notification_text = await text_element.text_content() if text_element else ""
-                    
-                    # Check if notification contains keywords
-                    text_lower = notification_text.lower()
-                    for keyword in keywords:
-                        if keyword in text_lower:
-                            matching_items.append({
-                                'type': 'notification',
-                                'sender': 'LinkedIn Notification',
-                                'preview': notification_text.strip(),
-                                'keyword_found': keyword
-                            })
-                            break  # Found a keyword, no need to check others
-                            
-                except Exception as e:
-                    print(f"Error processing notification: {e}")
-                    continue
+            for _, notification_text in notifications:
+                # Check if notification contains keywords
+                keyword = self.find_keyword(notification_text)
+                if keyword:
+                    matching_items.append({
+                        'type': 'notification',
+                        'sender': 'LinkedIn Notification',
+                        'preview': notification_text.strip(),
+                        'keyword_found': keyword
+                    })
         except Exception as e:
             print(f"Error checking notifications: {e}")
         
         return matching_items
     
-    def save_item_to_markdown(self, item_data):
+    async def check_messages_and_notifications(self):
+        """Check for new messages and notifications with business keywords"""
+        # Each list has its own tab, so both load at the same time
+        messages, notifications = await asyncio.gather(
+            self.check_messages(self.page),
+            self.check_notifications(self.page_notifications)
+        )
+        return messages + notifications
+    
+    def _write_file(self, filepath, content):
+        """Write the encoded content to filepath (blocking)."""
+        with open(filepath, 'wb') as f:
+            f.write(content)
+    
+    async def save_item_to_markdown(self, item_data):
         """Save item data to markdown file with YAML frontmatter"""
-        # Determine priority based on keyword
-        priority_map = {'sales': 'high', 'client': 'medium', 'project': 'medium'}
-        priority = priority_map.get(item_data['keyword_found'], 'low')
-        
-        # Create YAML frontmatter
-        yaml_frontmatter = f"""---
-type: linkedin_{item_data['type']}
-from: "{item_data['sender']}"
-subject: "LinkedIn {item_data['type']} - {item_data['keyword_found']} keyword found"
-received: "{datetime.now().isoformat()}"
-priority: {priority}
-status: pending
----
-"""
+        item_type = item_data['type']
+        keyword = item_data['keyword_found']
+        now = datetime.now()
         
-        # Create markdown content
-        content = f"{yaml_frontmatter}\n## LinkedIn {item_data['type'].title()} Details\n\nPreview: {item_data['preview']}\nKeyword found: {item_data['keyword_found']}\n\n"
+        # Render YAML frontmatter and markdown content straight to bytes
+        content = _LINKEDIN_TMPL % {
+            b'type': item_type.encode('utf-8'),
+            b'title': item_type.title().encode('utf-8'),
+            b'sender': item_data['sender'].encode('utf-8'),
+            b'keyword': keyword.encode('utf-8'),
+            b'received': now.isoformat().encode('ascii'),
+            b'priority': _PRIORITY_MAP.get(keyword, b'low'),
+            b'preview': item_data['preview'].encode('utf-8'),
+        }
         
         # Generate filename based on timestamp and sender
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        sender_clean = re.sub(r'[^\w\s-]', '', item_data['sender'])[:50]
-        filename = f"linkedin_{item_data['type']}_{timestamp}_{sender_clean}_{item_data['keyword_found']}.md"
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        sender_clean = _SENDER_CLEAN_RE.sub('', item_data['sender'])[:50]
+        filename = f"linkedin_{item_type}_{timestamp}_{sender_clean}_{keyword}.md"
         
-        # Save to Needs_Action directory
-        needs_action_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'Needs_Action')
-        filepath = os.path.join(needs_action_dir, filename)
+        # Save to Needs_Action directory, without blocking the event loop
+        filepath = os.path.join(self.needs_action_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(filepath, 'wb') as f:
+                await f.write(content)
+        else:
+            await asyncio.to_thread(self._write_file, filepath, content)
         
-        print(f"Saved LinkedIn {item_data['type']} to {filepath}")
+        print(f"Saved LinkedIn {item_type} to {filepath}")
 
     async def retry_with_backoff(self, func, *args, max_retries=None, base_delay=None, **kwargs):
         """Execute function with exponential backoff retry."""
@@ -247,8 +359,13 @@ status: pending
 
                     if matching_items:
                         for item in matching_items:
+                            # Still unread since an earlier cycle: already saved
+                            key = item_key(item['type'], item['sender'], item['preview'])
+                            if key in self.seen:
+                                continue
                             try:
-                                self.save_item_to_markdown(item)
+                                await self.save_item_to_markdown(item)
+                                self.seen.add(key)
                             except Exception as e:
                                 print(f"  Error saving item: {e}")
                                 self.error_recovery.log_error(
@@ -260,6 +377,7 @@ status: pending
                         print("  Skipped check (API error)")
 
                     print(f"Checked LinkedIn, found {len(matching_items) if matching_items else 0} matching items")
+                    self.seen.prune_if_due()
 
                     # Wait 60 seconds before next check
                     await self.page.wait_for_timeout(60000)
@@ -290,14 +408,20 @@ if __name__ == "__main__":
         def write(self, msg): pass
         def flush(self): pass
     
+    watcher = None
+    
     def signal_handler(sig, frame):
         print("\nLinkedIn Watcher stopped by user")
         sys.stdout.flush()
+        # os._exit skips atexit, so write out buffered error logs first
+        if watcher is not None:
+            watcher.error_recovery.flush()
         os._exit(0)  # Force immediate exit, no cleanup
     
     signal.signal(signal.SIGINT, signal_handler)
     
     async def main():
+        global watcher
         watcher = LinkedInWatcher()
         await watcher.run()
     
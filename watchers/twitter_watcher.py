@@ -12,13 +12,57 @@ import asyncio
 from datetime import datetime
 import re
 import sys
-import subprocess
 from playwright.async_api import async_playwright
 
 # Add parent directory to path for utils import
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'utils'))
 from error_recovery import ErrorRecovery
 
+# Win32 window enumeration for the Chrome-window check (in-process, no powershell)
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+    _kernel32 = ctypes.windll.kernel32
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+    def _pid_is_chrome(pid):
+        """Return True if the process with this PID is chrome.exe"""
+        handle = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            buf = ctypes.create_unicode_buffer(260)
+            size = wintypes.DWORD(len(buf))
+            if not _kernel32.QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+                return False
+            return os.path.basename(buf.value).lower() == 'chrome.exe'
+        finally:
+            _kernel32.CloseHandle(handle)
+
+    def _count_chrome_windows():
+        """Count visible top-level windows owned by chrome.exe processes"""
+        count = 0
+        pid_is_chrome = {}  # Chrome owns many windows per process; resolve each PID once
+
+        def callback(hwnd, _):
+            nonlocal count
+            if _user32.IsWindowVisible(hwnd):
+                pid = wintypes.DWORD()
+                _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+                is_chrome = pid_is_chrome.get(pid.value)
+                if is_chrome is None:
+                    is_chrome = pid_is_chrome[pid.value] = _pid_is_chrome(pid.value)
+                if is_chrome:
+                    count += 1
+            return True
+
+        _user32.EnumWindows(_EnumWindowsProc(callback), 0)
+        return count
+
 
 class TwitterWatcher:
     def __init__(self):
@@ -39,6 +83,8 @@ class TwitterWatcher:
         self.playwright = None
         self.browser = None
         self.page = None
+        # Set when the browser context or main page closes (the user closed the window)
+        self._closed_event = asyncio.Event()
 
         # Keywords to detect
         self.keywords = ['sales', 'client', 'project']
@@ -79,6 +125,11 @@ class TwitterWatcher:
             executable_path=chrome_path
         )
         self.page = await self.browser.new_page()
+        
+        # Closing the window fires these; wait_or_exit() sleeps on the event instead of polling
+        self._closed_event.clear()
+        self.browser.on('close', lambda *_: self._closed_event.set())
+        self.page.on('close', lambda *_: self._closed_event.set())
         return self.page
 
     async def check_window_closed_manually(self):
@@ -368,19 +419,8 @@ keyword: {item_data['keyword_found']}
     def _check_chrome_windows_windows(self):
         """Check if Chrome windows are visible on Windows"""
         try:
-            # Use tasklist to check for chrome processes
-            result = subprocess.run(
-                'powershell -Command "(Get-Process chrome -ErrorAction SilentlyContinue | Where-Object {$_.MainWindowHandle -ne 0}).Count"',
-                shell=True, capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                try:
-                    count = int(result.stdout.strip())
-                    if count == 0:
-                        return True  # No Chrome windows found
-                except ValueError:
-                    pass
-            return False
+            # EnumWindows in-process instead of spawning powershell on every check
+            return _count_chrome_windows() == 0  # True if no Chrome windows found
         except Exception:
             return False  # If we can't check, assume window is still open
 
@@ -424,7 +464,6 @@ keyword: {item_data['keyword_found']}
                 print("Stopping watcher gracefully...")
                 await self.cleanup()
                 # Exit with code 0 so PM2 won't restart
-                import sys
                 sys.exit(0)
                 return True
             
@@ -434,7 +473,6 @@ keyword: {item_data['keyword_found']}
                 print("Stopping watcher gracefully...")
                 await self.cleanup()
                 # Exit with code 0 so PM2 won't restart
-                import sys
                 sys.exit(0)
                 return True
             
@@ -446,7 +484,6 @@ keyword: {item_data['keyword_found']}
                 print("\n✓ Browser window closed by user.")
                 print("Stopping watcher gracefully...")
                 await self.cleanup()
-                import sys
                 sys.exit(0)
                 return True
             
@@ -457,7 +494,6 @@ keyword: {item_data['keyword_found']}
                     print("\n✓ Browser window closed by user.")
                     print("Stopping watcher gracefully...")
                     await self.cleanup()
-                    import sys
                     sys.exit(0)
                     return True
             
@@ -467,10 +503,31 @@ keyword: {item_data['keyword_found']}
             print("\n✓ Browser window closed by user.")
             print("Stopping watcher gracefully...")
             await self.cleanup()
-            import sys
             sys.exit(0)
             return True
 
+    async def wait_or_exit(self, timeout):
+        """
+        Wait up to timeout seconds, exiting cleanly if the browser window is closed.
+        
+        Args:
+            timeout: Seconds to wait before the next check
+        """
+        # One full check up front (page round-trip, Chrome window count on Windows)
+        # catches a close that no event reported
+        await self.check_browser_closed()
+        
+        try:
+            await asyncio.wait_for(self._closed_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return
+        
+        print("\n✓ Browser window closed by user.")
+        print("Stopping watcher gracefully...")
+        await self.cleanup()
+        # Exit with code 0 so PM2 won't restart
+        sys.exit(0)
+
     async def retry_with_backoff(self, func, *args, max_retries=None, base_delay=None, **kwargs):
         """
         Execute function with exponential backoff retry.
@@ -587,10 +644,8 @@ keyword: {item_data['keyword_found']}
                     total_found = (len(dms) if dms else 0) + (len(notifications) if notifications else 0) + (len(mentions) if mentions else 0)
                     print(f"  Found {total_found} matching items")
 
-                    # Wait 60 seconds before next check, checking browser status every 2 seconds
-                    for _ in range(30):  # 30 x 2 seconds = 60 seconds
-                        await self.check_browser_closed()
-                        await self.page.wait_for_timeout(2000)
+                    # Wait until the next check, or stop as soon as the browser window closes
+                    await self.wait_or_exit(self.check_interval)
 
                 except Exception as e:
                     error_msg = f"Error during monitoring: {type(e).__name__}: {e}"
@@ -601,8 +656,7 @@ keyword: {item_data['keyword_found']}
                         {'stage': 'monitoring_loop'}
                     )
                     # Graceful: wait and continue loop
-                    await self.check_browser_closed()
-                    await self.page.wait_for_timeout(self.check_interval * 1000)
+                    await self.wait_or_exit(self.check_interval)
 
         except Exception as e:
             error_msg = f"Twitter Watcher error: {type(e).__name__}: {e}"
@@ -255,14 +255,20 @@ if __name__ == "__main__":
         def write(self, msg): pass
         def flush(self): pass
     
+    watcher = None
+    
     def signal_handler(sig, frame):
         print("\nWhatsApp Watcher stopped by user")
         sys.stdout.flush()
+        # os._exit skips atexit, so write out buffered error logs first
+        if watcher is not None:
+            watcher.error_recovery.flush()
         os._exit(0)  # Force immediate exit, no cleanup
     
     signal.signal(signal.SIGINT, signal_handler)
     
     async def main():
+        global watcher
         watcher = WhatsAppWatcher()
         await watcher.run()
     